@@ -60,7 +60,7 @@ uint32 FMCPServerRunnable::Run()
                 while (bRunning)
                 {
                     int32 BytesRead = 0;
-                    if (ClientSocket->Recv(Buffer, sizeof(Buffer), BytesRead))
+                    if (ClientSocket->Recv(Buffer, sizeof(Buffer) - 1, BytesRead))
                     {
                         if (BytesRead == 0)
                         {
@@ -71,7 +71,7 @@ uint32 FMCPServerRunnable::Run()
                         // Convert received data to string
                         Buffer[BytesRead] = '\0';
                         FString ReceivedText = UTF8_TO_TCHAR(Buffer);
-                        UE_LOG(LogTemp, Display, TEXT("MCPServerRunnable: Received: %s"), *ReceivedText);
+                        UE_LOG(LogTemp, Verbose, TEXT("MCPServerRunnable: Received: %s"), *ReceivedText);
 
                         // Parse JSON
                         TSharedPtr<FJsonObject> JsonObject;
@@ -86,8 +86,8 @@ uint32 FMCPServerRunnable::Run()
                                 // Execute command
                                 FString Response = Bridge->ExecuteCommand(CommandType, JsonObject->GetObjectField(TEXT("params")));
                                 
-                                // Log response for debugging
-                                UE_LOG(LogTemp, Display, TEXT("MCPServerRunnable: Sending response: %s"), *Response);
+                                // Full payloads only at Verbose; large responses would flood the Output Log
+                                UE_LOG(LogTemp, Verbose, TEXT("MCPServerRunnable: Sending response: %s"), *Response);
                                 
                                 // Send response
                                 int32 BytesSent = 0;
@@ -96,7 +96,7 @@ uint32 FMCPServerRunnable::Run()
                                     UE_LOG(LogTemp, Warning, TEXT("MCPServerRunnable: Failed to send response"));
                                 }
                                 else {
-                                    UE_LOG(LogTemp, Display, TEXT("MCPServerRunnable: Response sent successfully, bytes: %d"), BytesSent);
+                                    UE_LOG(LogTemp, Verbose, TEXT("MCPServerRunnable: Response sent successfully, bytes: %d"), BytesSent);
                                 }
                             }
                             else
@@ -203,7 +203,7 @@ void FMCPServerRunnable::HandleClientConnection(TSharedPtr<FSocket> InClientSock
         bool bReadSuccess = false;
         
         UE_LOG(LogTemp, Display, TEXT("MCPServerRunnable: Attempting to receive data..."));
-        bReadSuccess = InClientSocket->Recv(Buffer, MaxBufferSize, BytesRead, ESocketReceiveFlags::None);
+        bReadSuccess = InClientSocket->Recv(Buffer, MaxBufferSize - 1, BytesRead, ESocketReceiveFlags::None);
         
         UE_LOG(LogTemp, Display, TEXT("MCPServerRunnable: Recv attempt complete - Success=%s, BytesRead=%d"), 
                bReadSuccess ? TEXT("true") : TEXT("false"), BytesRead);
@@ -312,7 +312,7 @@ void FMCPServerRunnable::ProcessMessage(TSharedPtr<FSocket> Client, const FStrin
     Response += TEXT("\n");
     int32 BytesSent = 0;
     
-    UE_LOG(LogTemp, Display, TEXT("MCPServerRunnable: Sending response: %s"), *Response);
+    UE_LOG(LogTemp, Verbose, TEXT("MCPServerRunnable: Sending response: %s"), *Response);
     
     if (!Client->Send((uint8*)TCHAR_TO_UTF8(*Response), Response.Len(), BytesSent))
     {
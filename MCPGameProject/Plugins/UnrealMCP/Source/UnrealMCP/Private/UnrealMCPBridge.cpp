@@ -212,121 +212,195 @@ FString UUnrealMCPBridge::ExecuteCommand(const FString& CommandType, const TShar
     // Queue execution on Game Thread
     AsyncTask(ENamedThreads::GameThread, [this, CommandType, Params, Promise = MoveTemp(Promise)]() mutable
     {
-        TSharedPtr<FJsonObject> ResponseJson = MakeShareable(new FJsonObject);
+        // A batch runs all of its commands in this one game thread task
+        TSharedPtr<FJsonObject> ResponseJson = CommandType == TEXT("batch_execute")
+            ? ExecuteBatch(Params)
+            : ExecuteCommandInternal(CommandType, Params);
         
-        try
+        FString ResultString;
+        TSharedRef<TJsonWriter<>> Writer = TJsonWriterFactory<>::Create(&ResultString);
+        FJsonSerializer::Serialize(ResponseJson.ToSharedRef(), Writer);
+        Promise.SetValue(ResultString);
+    });
+    
+    return Future.Get();
+}
+
+// Run a batch_execute request: {"commands": [{"command": ..., "params": {...}}, ...], "stopOnError": bool}
+// Each entry gets the same {status, result|error} object a single command would return,
+// collected into one "results" array so the whole batch is serialized once
+TSharedPtr<FJsonObject> UUnrealMCPBridge::ExecuteBatch(const TSharedPtr<FJsonObject>& Params)
+{
+    TSharedPtr<FJsonObject> ResponseJson = MakeShareable(new FJsonObject);
+    
+    const TArray<TSharedPtr<FJsonValue>>* Commands = nullptr;
+    if (!Params.IsValid() || !Params->TryGetArrayField(TEXT("commands"), Commands))
+    {
+        ResponseJson->SetStringField(TEXT("status"), TEXT("error"));
+        ResponseJson->SetStringField(TEXT("error"), TEXT("Missing 'commands' parameter"));
+        return ResponseJson;
+    }
+    
+    bool bStopOnError = false;
+    Params->TryGetBoolField(TEXT("stopOnError"), bStopOnError);
+    
+    TArray<TSharedPtr<FJsonValue>> Results;
+    Results.Reserve(Commands->Num());
+    
+    for (const TSharedPtr<FJsonValue>& CommandValue : *Commands)
+    {
+        const TSharedPtr<FJsonObject>* CommandObject = nullptr;
+        FString SubCommandType;
+        TSharedPtr<FJsonObject> SubResponse;
+        
+        if (!CommandValue->TryGetObject(CommandObject) || !(*CommandObject)->TryGetStringField(TEXT("command"), SubCommandType))
         {
-            TSharedPtr<FJsonObject> ResultJson;
-            
-            if (CommandType == TEXT("ping"))
-            {
-                ResultJson = MakeShareable(new FJsonObject);
-                ResultJson->SetStringField(TEXT("message"), TEXT("pong"));
-            }
-            // Editor Commands (including actor manipulation)
-            else if (CommandType == TEXT("get_actors_in_level") || 
-                     CommandType == TEXT("find_actors_by_name") ||
-                     CommandType == TEXT("spawn_actor") ||
-                     CommandType == TEXT("create_actor") ||
-                     CommandType == TEXT("delete_actor") || 
-                     CommandType == TEXT("set_actor_transform") ||
-                     CommandType == TEXT("get_actor_properties") ||
-                     CommandType == TEXT("set_actor_property") ||
-                     CommandType == TEXT("spawn_blueprint_actor") ||
-                     CommandType == TEXT("focus_viewport") || 
-                     CommandType == TEXT("take_screenshot"))
-            {
-                ResultJson = EditorCommands->HandleCommand(CommandType, Params);
-            }
-            // Blueprint Commands
-            else if (CommandType == TEXT("create_blueprint") || 
-                     CommandType == TEXT("add_component_to_blueprint") || 
-                     CommandType == TEXT("set_component_property") || 
-                     CommandType == TEXT("set_physics_properties") || 
-                     CommandType == TEXT("compile_blueprint") || 
-                     CommandType == TEXT("set_blueprint_property") || 
-                     CommandType == TEXT("set_static_mesh_properties") ||
-                     CommandType == TEXT("set_pawn_properties"))
-            {
-                ResultJson = BlueprintCommands->HandleCommand(CommandType, Params);
-            }
-            // Blueprint Node Commands
-            else if (CommandType == TEXT("connect_blueprint_nodes") || 
-                     CommandType == TEXT("add_blueprint_get_self_component_reference") ||
-                     CommandType == TEXT("add_blueprint_self_reference") ||
-                     CommandType == TEXT("find_blueprint_nodes") ||
-                     CommandType == TEXT("add_blueprint_event_node") ||
-                     CommandType == TEXT("add_blueprint_input_action_node") ||
-                     CommandType == TEXT("add_blueprint_function_node") ||
-                     CommandType == TEXT("add_blueprint_get_component_node") ||
-                     CommandType == TEXT("add_blueprint_variable"))
-            {
-                ResultJson = BlueprintNodeCommands->HandleCommand(CommandType, Params);
-            }
-            // Project Commands
-            else if (CommandType == TEXT("create_input_mapping"))
-            {
-                ResultJson = ProjectCommands->HandleCommand(CommandType, Params);
-            }
-            // UMG Commands
-            else if (CommandType == TEXT("create_umg_widget_blueprint") ||
-                     CommandType == TEXT("add_text_block_to_widget") ||
-                     CommandType == TEXT("add_button_to_widget") ||
-                     CommandType == TEXT("bind_widget_event") ||
-                     CommandType == TEXT("set_text_block_binding") ||
-                     CommandType == TEXT("add_widget_to_viewport"))
-            {
-                ResultJson = UMGCommands->HandleCommand(CommandType, Params);
-            }
-            else
-            {
-                ResponseJson->SetStringField(TEXT("status"), TEXT("error"));
-                ResponseJson->SetStringField(TEXT("error"), FString::Printf(TEXT("Unknown command: %s"), *CommandType));
-                
-                FString ResultString;
-                TSharedRef<TJsonWriter<>> Writer = TJsonWriterFactory<>::Create(&ResultString);
-                FJsonSerializer::Serialize(ResponseJson.ToSharedRef(), Writer);
-                Promise.SetValue(ResultString);
-                return;
-            }
-            
-            // Check if the result contains an error
-            bool bSuccess = true;
-            FString ErrorMessage;
-            
-            if (ResultJson->HasField(TEXT("success")))
-            {
-                bSuccess = ResultJson->GetBoolField(TEXT("success"));
-                if (!bSuccess && ResultJson->HasField(TEXT("error")))
-                {
-                    ErrorMessage = ResultJson->GetStringField(TEXT("error"));
-                }
-            }
+            SubResponse = MakeShareable(new FJsonObject);
+            SubResponse->SetStringField(TEXT("status"), TEXT("error"));
+            SubResponse->SetStringField(TEXT("error"), TEXT("Batch entry is missing 'command'"));
+        }
+        else if (SubCommandType == TEXT("batch_execute"))
+        {
+            SubResponse = MakeShareable(new FJsonObject);
+            SubResponse->SetStringField(TEXT("status"), TEXT("error"));
+            SubResponse->SetStringField(TEXT("error"), TEXT("batch_execute cannot be nested"));
+        }
+        else
+        {
+            UE_LOG(LogTemp, Display, TEXT("UnrealMCPBridge: Executing batch command: %s"), *SubCommandType);
             
-            if (bSuccess)
+            TSharedPtr<FJsonObject> SubParams = MakeShareable(new FJsonObject);
+            const TSharedPtr<FJsonObject>* SubParamsField = nullptr;
+            if ((*CommandObject)->TryGetObjectField(TEXT("params"), SubParamsField))
             {
-                // Set success status and include the result
-                ResponseJson->SetStringField(TEXT("status"), TEXT("success"));
-                ResponseJson->SetObjectField(TEXT("result"), ResultJson);
+                SubParams = *SubParamsField;
             }
-            else
+            SubResponse = ExecuteCommandInternal(SubCommandType, SubParams);
+        }
+        
+        Results.Add(MakeShareable(new FJsonValueObject(SubResponse)));
+        
+        if (bStopOnError && SubResponse->GetStringField(TEXT("status")) == TEXT("error"))
+        {
+            break;
+        }
+    }
+    
+    TSharedPtr<FJsonObject> ResultJson = MakeShareable(new FJsonObject);
+    ResultJson->SetArrayField(TEXT("results"), Results);
+    
+    ResponseJson->SetStringField(TEXT("status"), TEXT("success"));
+    ResponseJson->SetObjectField(TEXT("result"), ResultJson);
+    return ResponseJson;
+}
+
+// Dispatch a single command to its handler. Must be called on the game thread.
+TSharedPtr<FJsonObject> UUnrealMCPBridge::ExecuteCommandInternal(const FString& CommandType, const TSharedPtr<FJsonObject>& Params)
+{
+    TSharedPtr<FJsonObject> ResponseJson = MakeShareable(new FJsonObject);
+    
+    try
+    {
+        TSharedPtr<FJsonObject> ResultJson;
+        
+        if (CommandType == TEXT("ping"))
+        {
+            ResultJson = MakeShareable(new FJsonObject);
+            ResultJson->SetStringField(TEXT("message"), TEXT("pong"));
+        }
+        // Editor Commands (including actor manipulation)
+        else if (CommandType == TEXT("get_actors_in_level") || 
+                 CommandType == TEXT("find_actors_by_name") ||
+                 CommandType == TEXT("spawn_actor") ||
+                 CommandType == TEXT("create_actor") ||
+                 CommandType == TEXT("delete_actor") || 
+                 CommandType == TEXT("set_actor_transform") ||
+                 CommandType == TEXT("get_actor_properties") ||
+                 CommandType == TEXT("set_actor_property") ||
+                 CommandType == TEXT("spawn_blueprint_actor") ||
+                 CommandType == TEXT("focus_viewport") || 
+                 CommandType == TEXT("take_screenshot"))
+        {
+            ResultJson = EditorCommands->HandleCommand(CommandType, Params);
+        }
+        // Blueprint Commands
+        else if (CommandType == TEXT("create_blueprint") || 
+                 CommandType == TEXT("add_component_to_blueprint") || 
+                 CommandType == TEXT("set_component_property") || 
+                 CommandType == TEXT("set_physics_properties") || 
+                 CommandType == TEXT("compile_blueprint") || 
+                 CommandType == TEXT("set_blueprint_property") || 
+                 CommandType == TEXT("set_static_mesh_properties") ||
+                 CommandType == TEXT("set_pawn_properties"))
+        {
+            ResultJson = BlueprintCommands->HandleCommand(CommandType, Params);
+        }
+        // Blueprint Node Commands
+        else if (CommandType == TEXT("connect_blueprint_nodes") || 
+                 CommandType == TEXT("add_blueprint_get_self_component_reference") ||
+                 CommandType == TEXT("add_blueprint_self_reference") ||
+                 CommandType == TEXT("find_blueprint_nodes") ||
+                 CommandType == TEXT("add_blueprint_event_node") ||
+                 CommandType == TEXT("add_blueprint_input_action_node") ||
+                 CommandType == TEXT("add_blueprint_function_node") ||
+                 CommandType == TEXT("add_blueprint_get_component_node") ||
+                 CommandType == TEXT("add_blueprint_variable"))
+        {
+            ResultJson = BlueprintNodeCommands->HandleCommand(CommandType, Params);
+        }
+        // Project Commands
+        else if (CommandType == TEXT("create_input_mapping"))
+        {
+            ResultJson = ProjectCommands->HandleCommand(CommandType, Params);
+        }
+        // UMG Commands
+        else if (CommandType == TEXT("create_umg_widget_blueprint") ||
+                 CommandType == TEXT("add_text_block_to_widget") ||
+                 CommandType == TEXT("add_button_to_widget") ||
+                 CommandType == TEXT("bind_widget_event") ||
+                 CommandType == TEXT("set_text_block_binding") ||
+                 CommandType == TEXT("add_widget_to_viewport"))
+        {
+            ResultJson = UMGCommands->HandleCommand(CommandType, Params);
+        }
+        else
+        {
+            ResponseJson->SetStringField(TEXT("status"), TEXT("error"));
+            ResponseJson->SetStringField(TEXT("error"), FString::Printf(TEXT("Unknown command: %s"), *CommandType));
+            return ResponseJson;
+        }
+        
+        // Check if the result contains an error
+        bool bSuccess = true;
+        FString ErrorMessage;
+        
+        if (ResultJson->HasField(TEXT("success")))
+        {
+            bSuccess = ResultJson->GetBoolField(TEXT("success"));
+            if (!bSuccess && ResultJson->HasField(TEXT("error")))
             {
-                // Set error status and include the error message
-                ResponseJson->SetStringField(TEXT("status"), TEXT("error"));
-                ResponseJson->SetStringField(TEXT("error"), ErrorMessage);
+                ErrorMessage = ResultJson->GetStringField(TEXT("error"));
             }
         }
-        catch (const std::exception& e)
+        
+        if (bSuccess)
         {
+            // Set success status and include the result
+            ResponseJson->SetStringField(TEXT("status"), TEXT("success"));
+            ResponseJson->SetObjectField(TEXT("result"), ResultJson);
+        }
+        else
+        {
+            // Set error status and include the error message
             ResponseJson->SetStringField(TEXT("status"), TEXT("error"));
-            ResponseJson->SetStringField(TEXT("error"), UTF8_TO_TCHAR(e.what()));
+            ResponseJson->SetStringField(TEXT("error"), ErrorMessage);
         }
-        
-        FString ResultString;
-        TSharedRef<TJsonWriter<>> Writer = TJsonWriterFactory<>::Create(&ResultString);
-        FJsonSerializer::Serialize(ResponseJson.ToSharedRef(), Writer);
-        Promise.SetValue(ResultString);
-    });
+    }
+    catch (const std::exception& e)
+    {
+        ResponseJson->SetStringField(TEXT("status"), TEXT("error"));
+        ResponseJson->SetStringField(TEXT("error"), UTF8_TO_TCHAR(e.what()));
+    }
     
-    return Future.Get();
-}
\ No newline at end of file
+    return ResponseJson;
+}
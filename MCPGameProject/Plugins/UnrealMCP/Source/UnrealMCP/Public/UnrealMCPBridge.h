@@ -45,6 +45,10 @@ public:
 	FString ExecuteCommand(const FString& CommandType, const TSharedPtr<FJsonObject>& Params);
 
 private:
+	// Game-thread command execution, returning the {status, result|error} response object
+	TSharedPtr<FJsonObject> ExecuteCommandInternal(const FString& CommandType, const TSharedPtr<FJsonObject>& Params);
+	TSharedPtr<FJsonObject> ExecuteBatch(const TSharedPtr<FJsonObject>& Params);
+
 	// Server state
 	bool bIsRunning;
 	TSharedPtr<FSocket> ListenerSocket;
@@ -0,0 +1,230 @@
+#!/usr/bin/env python
+"""
+Test script for running several commands in one batch_execute request via MCP.
+
+This script exercises the batch_execute command and the client-side batching:
+- Running a batch with stopOnError false and true, including a failing entry
+- Rejecting a nested batch_execute entry
+- Rejecting an entry without a command name
+- Sending a batch larger than the plugin's 8 KB read through UnrealConnection.send_batch,
+  which splits it into several requests, and checking the results come back complete and in order
+"""
+
+import sys
+import os
+import socket
+import json
+import logging
+from typing import Dict, Any, List, Optional
+
+# Add the parent directory to the path so we can import the server module
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from unreal_mcp_server import UnrealConnection, UNREAL_MAX_COMMAND_BYTES
+
+# Set up logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger("TestBatchExecute")
+
+CUBE_NAME = "BatchTestCube"
+MISSING_ACTOR_NAME = "BatchTestMissingActor"
+LARGE_BATCH_SIZE = 150
+
+def send_command(command: str, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Send a command to the Unreal MCP server and get the response.
+
+    Args:
+        command: The command type to send
+        params: Dictionary of parameters for the command
+
+    Returns:
+        Optional[Dict[str, Any]]: The response from the server, or None if there was an error
+    """
+    try:
+        # Create new socket connection
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.connect(("127.0.0.1", 55557))
+
+        try:
+            # Create command object
+            command_obj = {
+                "type": command,
+                "params": params
+            }
+
+            # Convert to JSON and send
+            command_json = json.dumps(command_obj)
+            logger.info(f"Sending command: {command_json}")
+            sock.sendall(command_json.encode('utf-8'))
+
+            # Receive response
+            chunks = []
+            while True:
+                chunk = sock.recv(4096)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+
+                # Try parsing to see if we have a complete response
+                try:
+                    data = b''.join(chunks)
+                    json.loads(data.decode('utf-8'))
+                    # If we can parse it, we have the complete response
+                    break
+                except json.JSONDecodeError:
+                    # Not a complete JSON object yet, continue receiving
+                    continue
+
+            # Parse response
+            data = b''.join(chunks)
+            response = json.loads(data.decode('utf-8'))
+            logger.info(f"Received response: {response}")
+            return response
+
+        finally:
+            # Always close the socket
+            sock.close()
+
+    except Exception as e:
+        logger.error(f"Error sending command: {e}")
+        return None
+
+def get_batch_statuses(response: Optional[Dict[str, Any]]) -> Optional[List[str]]:
+    """Get the per-entry statuses of a batch_execute response.
+
+    Args:
+        response: The response to a batch_execute request
+
+    Returns:
+        Optional[List[str]]: The status of each entry in order, or None if the batch itself failed
+    """
+    if not response or response.get("status") != "success":
+        logger.error(f"Batch request failed: {response}")
+        return None
+    return [result.get("status") for result in response["result"]["results"]]
+
+def test_batch_without_stop_on_error() -> bool:
+    """Run a batch with a failing entry in the middle; every entry should still run."""
+    response = send_command("batch_execute", {
+        "commands": [
+            {"command": "spawn_actor", "params": {"name": CUBE_NAME, "type": "StaticMeshActor", "location": [0.0, 0.0, 100.0]}},
+            {"command": "get_actor_properties", "params": {"name": MISSING_ACTOR_NAME}},
+            {"command": "set_actor_transform", "params": {"name": CUBE_NAME, "location": [0.0, 0.0, 200.0]}}
+        ],
+        "stopOnError": False
+    })
+    statuses = get_batch_statuses(response)
+    if statuses != ["success", "error", "success"]:
+        logger.error(f"Unexpected statuses with stopOnError false: {statuses}")
+        return False
+
+    logger.info("Batch without stopOnError ran every entry")
+    return True
+
+def test_batch_with_stop_on_error() -> bool:
+    """Run a batch with a failing entry in the middle; the entries after it should be skipped."""
+    response = send_command("batch_execute", {
+        "commands": [
+            {"command": "get_actor_properties", "params": {"name": CUBE_NAME}},
+            {"command": "get_actor_properties", "params": {"name": MISSING_ACTOR_NAME}},
+            {"command": "get_actor_properties", "params": {"name": CUBE_NAME}}
+        ],
+        "stopOnError": True
+    })
+    statuses = get_batch_statuses(response)
+    if statuses != ["success", "error"]:
+        logger.error(f"Unexpected statuses with stopOnError true: {statuses}")
+        return False
+
+    logger.info("Batch with stopOnError stopped at the failing entry")
+    return True
+
+def test_nested_batch() -> bool:
+    """A batch_execute entry inside a batch should be rejected without stopping the batch."""
+    response = send_command("batch_execute", {
+        "commands": [
+            {"command": "batch_execute", "params": {"commands": [{"command": "ping"}]}},
+            {"command": "ping"}
+        ]
+    })
+    statuses = get_batch_statuses(response)
+    if statuses != ["error", "success"]:
+        logger.error(f"Unexpected statuses for nested batch: {statuses}")
+        return False
+
+    logger.info(f"Nested batch rejected: {response['result']['results'][0].get('error')}")
+    return True
+
+def test_entry_without_command() -> bool:
+    """An entry without a command name should be rejected without stopping the batch."""
+    response = send_command("batch_execute", {
+        "commands": [
+            {"params": {"name": CUBE_NAME}},
+            {"command": "ping"}
+        ]
+    })
+    statuses = get_batch_statuses(response)
+    if statuses != ["error", "success"]:
+        logger.error(f"Unexpected statuses for entry without command: {statuses}")
+        return False
+
+    logger.info(f"Entry without command rejected: {response['result']['results'][0].get('error')}")
+    return True
+
+def test_large_batch() -> bool:
+    """Send a batch over 8 KB through UnrealConnection.send_batch and check every result in order."""
+    commands = [
+        {"command": "set_actor_transform", "params": {"name": CUBE_NAME, "location": [0.0, 0.0, float(i)]}}
+        for i in range(LARGE_BATCH_SIZE)
+    ]
+    batch_size = len(json.dumps({"type": "batch_execute", "params": {"commands": commands}}))
+    if batch_size <= UNREAL_MAX_COMMAND_BYTES:
+        logger.error(f"Large batch is only {batch_size} bytes, not over the {UNREAL_MAX_COMMAND_BYTES} byte limit")
+        return False
+
+    connection = UnrealConnection()
+    try:
+        response = connection.send_batch(commands)
+    finally:
+        connection.disconnect()
+
+    statuses = get_batch_statuses(response)
+    if statuses != ["success"] * LARGE_BATCH_SIZE:
+        logger.error(f"Unexpected statuses for large batch: {statuses}")
+        return False
+
+    heights = [result["result"]["location"][2] for result in response["result"]["results"]]
+    if heights != [float(i) for i in range(LARGE_BATCH_SIZE)]:
+        logger.error(f"Large batch results are out of order: {heights}")
+        return False
+
+    logger.info(f"Large batch of {batch_size} bytes returned all {LARGE_BATCH_SIZE} results in order")
+    return True
+
+def main():
+    """Main function to test batch_execute."""
+    try:
+        # Remove a cube left over from an earlier run; an error just means there was none
+        send_command("delete_actor", {"name": CUBE_NAME})
+
+        tests = [
+            test_batch_without_stop_on_error,
+            test_batch_with_stop_on_error,
+            test_nested_batch,
+            test_entry_without_command,
+            test_large_batch
+        ]
+        for test in tests:
+            if not test():
+                logger.error(f"{test.__name__} failed")
+                sys.exit(1)
+
+        send_command("delete_actor", {"name": CUBE_NAME})
+        logger.info("All test operations completed successfully!")
+
+    except Exception as e:
+        logger.error(f"Error in main: {e}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -4,6 +4,7 @@ Blueprint Tools for Unreal MCP.
 This module provides tools for creating and manipulating Blueprint assets in Unreal Engine.
 """
 
+import asyncio
 import logging
 from typing import Dict, List, Any
 from mcp.server.fastmcp import FastMCP, Context
@@ -15,22 +16,22 @@ def register_blueprint_tools(mcp: FastMCP):
     """Register Blueprint tools with the MCP server."""
     
     @mcp.tool()
-    def create_blueprint(
+    async def create_blueprint(
         ctx: Context,
         name: str,
         parent_class: str
     ) -> Dict[str, Any]:
         """Create a new Blueprint class."""
         # Import inside function to avoid circular imports
-        from unreal_mcp_server import get_unreal_connection
+        from unreal_mcp_server import get_unreal_connection, LogExcerpt
         
         try:
-            unreal = get_unreal_connection()
+            unreal = await asyncio.to_thread(get_unreal_connection)
             if not unreal:
                 logger.error("Failed to connect to Unreal Engine")
                 return {"success": False, "message": "Failed to connect to Unreal Engine"}
                 
-            response = unreal.send_command("create_blueprint", {
+            response = await asyncio.to_thread(unreal.send_command, "create_blueprint", {
                 "name": name,
                 "parent_class": parent_class
             })
@@ -39,7 +40,7 @@ def register_blueprint_tools(mcp: FastMCP):
                 logger.error("No response from Unreal Engine")
                 return {"success": False, "message": "No response from Unreal Engine"}
             
-            logger.info(f"Blueprint creation response: {response}")
+            logger.info("Blueprint creation response: %s", LogExcerpt(response))
             return response or {}
             
         except Exception as e:
@@ -48,7 +49,7 @@ def register_blueprint_tools(mcp: FastMCP):
             return {"success": False, "message": error_msg}
     
     @mcp.tool()
-    def add_component_to_blueprint(
+    async def add_component_to_blueprint(
         ctx: Context,
         blueprint_name: str,
         component_type: str,
@@ -73,7 +74,7 @@ def register_blueprint_tools(mcp: FastMCP):
         Returns:
             Information about the added component
         """
-        from unreal_mcp_server import get_unreal_connection
+        from unreal_mcp_server import get_unreal_connection, LogExcerpt
         
         try:
             # Ensure all parameters are properly formatted
@@ -94,24 +95,24 @@ def register_blueprint_tools(mcp: FastMCP):
             for param_name in ["location", "rotation", "scale"]:
                 param_value = params[param_name]
                 if not isinstance(param_value, list) or len(param_value) != 3:
-                    logger.error(f"Invalid {param_name} format: {param_value}. Must be a list of 3 float values.")
+                    logger.error("Invalid %s format: %s. Must be a list of 3 float values.", param_name, param_value)
                     return {"success": False, "message": f"Invalid {param_name} format. Must be a list of 3 float values."}
                 # Ensure all values are float
                 params[param_name] = [float(val) for val in param_value]
             
-            unreal = get_unreal_connection()
+            unreal = await asyncio.to_thread(get_unreal_connection)
             if not unreal:
                 logger.error("Failed to connect to Unreal Engine")
                 return {"success": False, "message": "Failed to connect to Unreal Engine"}
                 
-            logger.info(f"Adding component to blueprint with params: {params}")
-            response = unreal.send_command("add_component_to_blueprint", params)
+            logger.info("Adding component to blueprint with params: %s", params)
+            response = await asyncio.to_thread(unreal.send_command, "add_component_to_blueprint", params)
             
             if not response:
                 logger.error("No response from Unreal Engine")
                 return {"success": False, "message": "No response from Unreal Engine"}
             
-            logger.info(f"Component addition response: {response}")
+            logger.info("Component addition response: %s", LogExcerpt(response))
             return response
             
         except Exception as e:
@@ -120,7 +121,7 @@ def register_blueprint_tools(mcp: FastMCP):
             return {"success": False, "message": error_msg}
     
     @mcp.tool()
-    def set_static_mesh_properties(
+    async def set_static_mesh_properties(
         ctx: Context,
         blueprint_name: str,
         component_name: str,
@@ -137,10 +138,10 @@ def register_blueprint_tools(mcp: FastMCP):
         Returns:
             Response indicating success or failure
         """
-        from unreal_mcp_server import get_unreal_connection
+        from unreal_mcp_server import get_unreal_connection, LogExcerpt
         
         try:
-            unreal = get_unreal_connection()
+            unreal = await asyncio.to_thread(get_unreal_connection)
             if not unreal:
                 logger.error("Failed to connect to Unreal Engine")
                 return {"success": False, "message": "Failed to connect to Unreal Engine"}
@@ -151,14 +152,14 @@ def register_blueprint_tools(mcp: FastMCP):
                 "static_mesh": static_mesh
             }
             
-            logger.info(f"Setting static mesh properties with params: {params}")
-            response = unreal.send_command("set_static_mesh_properties", params)
+            logger.info("Setting static mesh properties with params: %s", params)
+            response = await asyncio.to_thread(unreal.send_command, "set_static_mesh_properties", params)
             
             if not response:
                 logger.error("No response from Unreal Engine")
                 return {"success": False, "message": "No response from Unreal Engine"}
             
-            logger.info(f"Set static mesh properties response: {response}")
+            logger.info("Set static mesh properties response: %s", LogExcerpt(response))
             return response
             
         except Exception as e:
@@ -167,7 +168,7 @@ def register_blueprint_tools(mcp: FastMCP):
             return {"success": False, "message": error_msg}
     
     @mcp.tool()
-    def set_component_property(
+    async def set_component_property(
         ctx: Context,
         blueprint_name: str,
         component_name: str,
@@ -175,10 +176,10 @@ def register_blueprint_tools(mcp: FastMCP):
         property_value,
     ) -> Dict[str, Any]:
         """Set a property on a component in a Blueprint."""
-        from unreal_mcp_server import get_unreal_connection
+        from unreal_mcp_server import get_unreal_connection, LogExcerpt
         
         try:
-            unreal = get_unreal_connection()
+            unreal = await asyncio.to_thread(get_unreal_connection)
             if not unreal:
                 logger.error("Failed to connect to Unreal Engine")
                 return {"success": False, "message": "Failed to connect to Unreal Engine"}
@@ -190,14 +191,14 @@ def register_blueprint_tools(mcp: FastMCP):
                 "property_value": property_value
             }
             
-            logger.info(f"Setting component property with params: {params}")
-            response = unreal.send_command("set_component_property", params)
+            logger.info("Setting component property with params: %s", params)
+            response = await asyncio.to_thread(unreal.send_command, "set_component_property", params)
             
             if not response:
                 logger.error("No response from Unreal Engine")
                 return {"success": False, "message": "No response from Unreal Engine"}
             
-            logger.info(f"Set component property response: {response}")
+            logger.info("Set component property response: %s", LogExcerpt(response))
             return response
             
         except Exception as e:
@@ -206,7 +207,7 @@ def register_blueprint_tools(mcp: FastMCP):
             return {"success": False, "message": error_msg}
     
     @mcp.tool()
-    def set_physics_properties(
+    async def set_physics_properties(
         ctx: Context,
         blueprint_name: str,
         component_name: str,
@@ -217,10 +218,10 @@ def register_blueprint_tools(mcp: FastMCP):
         angular_damping: float = 0.0
     ) -> Dict[str, Any]:
         """Set physics properties on a component."""
-        from unreal_mcp_server import get_unreal_connection
+        from unreal_mcp_server import get_unreal_connection, LogExcerpt
         
         try:
-            unreal = get_unreal_connection()
+            unreal = await asyncio.to_thread(get_unreal_connection)
             if not unreal:
                 logger.error("Failed to connect to Unreal Engine")
                 return {"success": False, "message": "Failed to connect to Unreal Engine"}
@@ -235,14 +236,14 @@ def register_blueprint_tools(mcp: FastMCP):
                 "angular_damping": float(angular_damping)
             }
             
-            logger.info(f"Setting physics properties with params: {params}")
-            response = unreal.send_command("set_physics_properties", params)
+            logger.info("Setting physics properties with params: %s", params)
+            response = await asyncio.to_thread(unreal.send_command, "set_physics_properties", params)
             
             if not response:
                 logger.error("No response from Unreal Engine")
                 return {"success": False, "message": "No response from Unreal Engine"}
             
-            logger.info(f"Set physics properties response: {response}")
+            logger.info("Set physics properties response: %s", LogExcerpt(response))
             return response
             
         except Exception as e:
@@ -251,15 +252,15 @@ def register_blueprint_tools(mcp: FastMCP):
             return {"success": False, "message": error_msg}
     
     @mcp.tool()
-    def compile_blueprint(
+    async def compile_blueprint(
         ctx: Context,
         blueprint_name: str
     ) -> Dict[str, Any]:
         """Compile a Blueprint."""
-        from unreal_mcp_server import get_unreal_connection
+        from unreal_mcp_server import get_unreal_connection, LogExcerpt
         
         try:
-            unreal = get_unreal_connection()
+            unreal = await asyncio.to_thread(get_unreal_connection)
             if not unreal:
                 logger.error("Failed to connect to Unreal Engine")
                 return {"success": False, "message": "Failed to connect to Unreal Engine"}
@@ -268,14 +269,14 @@ def register_blueprint_tools(mcp: FastMCP):
                 "blueprint_name": blueprint_name
             }
             
-            logger.info(f"Compiling blueprint: {blueprint_name}")
-            response = unreal.send_command("compile_blueprint", params)
+            logger.info("Compiling blueprint: %s", blueprint_name)
+            response = await asyncio.to_thread(unreal.send_command, "compile_blueprint", params)
             
             if not response:
                 logger.error("No response from Unreal Engine")
                 return {"success": False, "message": "No response from Unreal Engine"}
             
-            logger.info(f"Compile blueprint response: {response}")
+            logger.info("Compile blueprint response: %s", LogExcerpt(response))
             return response
             
         except Exception as e:
@@ -284,7 +285,7 @@ def register_blueprint_tools(mcp: FastMCP):
             return {"success": False, "message": error_msg}
 
     @mcp.tool()
-    def set_blueprint_property(
+    async def set_blueprint_property(
         ctx: Context,
         blueprint_name: str,
         property_name: str,
@@ -301,10 +302,10 @@ def register_blueprint_tools(mcp: FastMCP):
         Returns:
             Response indicating success or failure
         """
-        from unreal_mcp_server import get_unreal_connection
+        from unreal_mcp_server import get_unreal_connection, LogExcerpt
         
         try:
-            unreal = get_unreal_connection()
+            unreal = await asyncio.to_thread(get_unreal_connection)
             if not unreal:
                 logger.error("Failed to connect to Unreal Engine")
                 return {"success": False, "message": "Failed to connect to Unreal Engine"}
@@ -315,14 +316,14 @@ def register_blueprint_tools(mcp: FastMCP):
                 "property_value": property_value
             }
             
-            logger.info(f"Setting blueprint property with params: {params}")
-            response = unreal.send_command("set_blueprint_property", params)
+            logger.info("Setting blueprint property with params: %s", params)
+            response = await asyncio.to_thread(unreal.send_command, "set_blueprint_property", params)
             
             if not response:
                 logger.error("No response from Unreal Engine")
                 return {"success": False, "message": "No response from Unreal Engine"}
             
-            logger.info(f"Set blueprint property response: {response}")
+            logger.info("Set blueprint property response: %s", LogExcerpt(response))
             return response
             
         except Exception as e:
@@ -331,7 +332,7 @@ def register_blueprint_tools(mcp: FastMCP):
             return {"success": False, "message": error_msg}
 
     # @mcp.tool() commented out, just use set_component_property instead
-    def set_pawn_properties(
+    async def set_pawn_properties(
         ctx: Context,
         blueprint_name: str,
         auto_possess_player: str = "",
@@ -358,7 +359,7 @@ def register_blueprint_tools(mcp: FastMCP):
         from unreal_mcp_server import get_unreal_connection
         
         try:
-            unreal = get_unreal_connection()
+            unreal = await asyncio.to_thread(get_unreal_connection)
             if not unreal:
                 logger.error("Failed to connect to Unreal Engine")
                 return {"success": False, "message": "Failed to connect to Unreal Engine"}
@@ -393,11 +394,11 @@ def register_blueprint_tools(mcp: FastMCP):
                     "property_value": prop_value
                 }
                 
-                logger.info(f"Setting pawn property {prop_name} to {prop_value}")
-                response = unreal.send_command("set_blueprint_property", params)
+                logger.info("Setting pawn property %s to %s", prop_name, prop_value)
+                response = await asyncio.to_thread(unreal.send_command, "set_blueprint_property", params)
                 
                 if not response:
-                    logger.error(f"No response from Unreal Engine for property {prop_name}")
+                    logger.error("No response from Unreal Engine for property %s", prop_name)
                     results[prop_name] = {"success": False, "message": "No response from Unreal Engine"}
                     overall_success = False
                     continue
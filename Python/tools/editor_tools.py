@@ -4,6 +4,7 @@ Editor Tools for Unreal MCP.
 This module provides tools for controlling the Unreal Editor viewport and other editor functionality.
 """
 
+import asyncio
 import logging
 from typing import Dict, List, Any, Optional
 from mcp.server.fastmcp import FastMCP, Context
@@ -15,54 +16,54 @@ def register_editor_tools(mcp: FastMCP):
     """Register editor tools with the MCP server."""
     
     @mcp.tool()
-    def get_actors_in_level(ctx: Context) -> List[Dict[str, Any]]:
+    async def get_actors_in_level(ctx: Context) -> List[Dict[str, Any]]:
         """Get a list of all actors in the current level."""
         from unreal_mcp_server import get_unreal_connection
         
         try:
-            unreal = get_unreal_connection()
+            unreal = await asyncio.to_thread(get_unreal_connection)
             if not unreal:
                 logger.warning("Failed to connect to Unreal Engine")
                 return []
                 
-            response = unreal.send_command("get_actors_in_level", {})
+            response = await asyncio.to_thread(unreal.send_command, "get_actors_in_level", {})
             
             if not response:
                 logger.warning("No response from Unreal Engine")
                 return []
                 
             # Log the complete response for debugging
-            logger.info(f"Complete response from Unreal: {response}")
+            logger.debug("Complete response from Unreal: %s", response)
             
             # Check response format
             if "result" in response and "actors" in response["result"]:
                 actors = response["result"]["actors"]
-                logger.info(f"Found {len(actors)} actors in level")
+                logger.info("Found %d actors in level", len(actors))
                 return actors
             elif "actors" in response:
                 actors = response["actors"]
-                logger.info(f"Found {len(actors)} actors in level")
+                logger.info("Found %d actors in level", len(actors))
                 return actors
                 
-            logger.warning(f"Unexpected response format: {response}")
+            logger.warning("Unexpected response format: %s", response)
             return []
             
         except Exception as e:
-            logger.error(f"Error getting actors: {e}")
+            logger.error("Error getting actors: %s", e)
             return []
 
     @mcp.tool()
-    def find_actors_by_name(ctx: Context, pattern: str) -> List[str]:
+    async def find_actors_by_name(ctx: Context, pattern: str) -> List[str]:
         """Find actors by name pattern."""
         from unreal_mcp_server import get_unreal_connection
         
         try:
-            unreal = get_unreal_connection()
+            unreal = await asyncio.to_thread(get_unreal_connection)
             if not unreal:
                 logger.warning("Failed to connect to Unreal Engine")
                 return []
                 
-            response = unreal.send_command("find_actors_by_name", {
+            response = await asyncio.to_thread(unreal.send_command, "find_actors_by_name", {
                 "pattern": pattern
             })
             
@@ -72,11 +73,11 @@ def register_editor_tools(mcp: FastMCP):
             return response.get("actors", [])
             
         except Exception as e:
-            logger.error(f"Error finding actors: {e}")
+            logger.error("Error finding actors: %s", e)
             return []
     
     @mcp.tool()
-    def spawn_actor(
+    async def spawn_actor(
         ctx: Context,
         name: str,
         type: str,
@@ -95,10 +96,10 @@ def register_editor_tools(mcp: FastMCP):
         Returns:
             Dict containing the created actor's properties
         """
-        from unreal_mcp_server import get_unreal_connection
+        from unreal_mcp_server import get_unreal_connection, LogExcerpt
         
         try:
-            unreal = get_unreal_connection()
+            unreal = await asyncio.to_thread(get_unreal_connection)
             if not unreal:
                 logger.error("Failed to connect to Unreal Engine")
                 return {"success": False, "message": "Failed to connect to Unreal Engine"}
@@ -115,25 +116,25 @@ def register_editor_tools(mcp: FastMCP):
             for param_name in ["location", "rotation"]:
                 param_value = params[param_name]
                 if not isinstance(param_value, list) or len(param_value) != 3:
-                    logger.error(f"Invalid {param_name} format: {param_value}. Must be a list of 3 float values.")
+                    logger.error("Invalid %s format: %s. Must be a list of 3 float values.", param_name, param_value)
                     return {"success": False, "message": f"Invalid {param_name} format. Must be a list of 3 float values."}
                 # Ensure all values are float
                 params[param_name] = [float(val) for val in param_value]
             
-            logger.info(f"Creating actor '{name}' of type '{type}' with params: {params}")
-            response = unreal.send_command("spawn_actor", params)
+            logger.info("Creating actor '%s' of type '%s' with params: %s", name, type, params)
+            response = await asyncio.to_thread(unreal.send_command, "spawn_actor", params)
             
             if not response:
                 logger.error("No response from Unreal Engine")
                 return {"success": False, "message": "No response from Unreal Engine"}
             
             # Log the complete response for debugging
-            logger.info(f"Actor creation response: {response}")
+            logger.info("Actor creation response: %s", LogExcerpt(response))
             
             # Handle error responses correctly
             if response.get("status") == "error":
                 error_message = response.get("error", "Unknown error")
-                logger.error(f"Error creating actor: {error_message}")
+                logger.error("Error creating actor: %s", error_message)
                 return {"success": False, "message": error_message}
             
             return response
@@ -144,27 +145,27 @@ def register_editor_tools(mcp: FastMCP):
             return {"success": False, "message": error_msg}
     
     @mcp.tool()
-    def delete_actor(ctx: Context, name: str) -> Dict[str, Any]:
+    async def delete_actor(ctx: Context, name: str) -> Dict[str, Any]:
         """Delete an actor by name."""
         from unreal_mcp_server import get_unreal_connection
         
         try:
-            unreal = get_unreal_connection()
+            unreal = await asyncio.to_thread(get_unreal_connection)
             if not unreal:
                 logger.error("Failed to connect to Unreal Engine")
                 return {"success": False, "message": "Failed to connect to Unreal Engine"}
                 
-            response = unreal.send_command("delete_actor", {
+            response = await asyncio.to_thread(unreal.send_command, "delete_actor", {
                 "name": name
             })
             return response or {}
             
         except Exception as e:
-            logger.error(f"Error deleting actor: {e}")
+            logger.error("Error deleting actor: %s", e)
             return {}
     
     @mcp.tool()
-    def set_actor_transform(
+    async def set_actor_transform(
         ctx: Context,
         name: str,
         location: List[float]  = None,
@@ -175,7 +176,7 @@ def register_editor_tools(mcp: FastMCP):
         from unreal_mcp_server import get_unreal_connection
         
         try:
-            unreal = get_unreal_connection()
+            unreal = await asyncio.to_thread(get_unreal_connection)
             if not unreal:
                 logger.error("Failed to connect to Unreal Engine")
                 return {"success": False, "message": "Failed to connect to Unreal Engine"}
@@ -188,35 +189,35 @@ def register_editor_tools(mcp: FastMCP):
             if scale is not None:
                 params["scale"] = scale
                 
-            response = unreal.send_command("set_actor_transform", params)
+            response = await asyncio.to_thread(unreal.send_command, "set_actor_transform", params)
             return response or {}
             
         except Exception as e:
-            logger.error(f"Error setting transform: {e}")
+            logger.error("Error setting transform: %s", e)
             return {}
     
     @mcp.tool()
-    def get_actor_properties(ctx: Context, name: str) -> Dict[str, Any]:
+    async def get_actor_properties(ctx: Context, name: str) -> Dict[str, Any]:
         """Get all properties of an actor."""
         from unreal_mcp_server import get_unreal_connection
         
         try:
-            unreal = get_unreal_connection()
+            unreal = await asyncio.to_thread(get_unreal_connection)
             if not unreal:
                 logger.error("Failed to connect to Unreal Engine")
                 return {"success": False, "message": "Failed to connect to Unreal Engine"}
                 
-            response = unreal.send_command("get_actor_properties", {
+            response = await asyncio.to_thread(unreal.send_command, "get_actor_properties", {
                 "name": name
             })
             return response or {}
             
         except Exception as e:
-            logger.error(f"Error getting properties: {e}")
+            logger.error("Error getting properties: %s", e)
             return {}
 
     @mcp.tool()
-    def set_actor_property(
+    async def set_actor_property(
         ctx: Context,
         name: str,
         property_name: str,
@@ -233,15 +234,15 @@ def register_editor_tools(mcp: FastMCP):
         Returns:
             Dict containing response from Unreal with operation status
         """
-        from unreal_mcp_server import get_unreal_connection
+        from unreal_mcp_server import get_unreal_connection, LogExcerpt
         
         try:
-            unreal = get_unreal_connection()
+            unreal = await asyncio.to_thread(get_unreal_connection)
             if not unreal:
                 logger.error("Failed to connect to Unreal Engine")
                 return {"success": False, "message": "Failed to connect to Unreal Engine"}
                 
-            response = unreal.send_command("set_actor_property", {
+            response = await asyncio.to_thread(unreal.send_command, "set_actor_property", {
                 "name": name,
                 "property_name": property_name,
                 "property_value": property_value
@@ -251,7 +252,7 @@ def register_editor_tools(mcp: FastMCP):
                 logger.error("No response from Unreal Engine")
                 return {"success": False, "message": "No response from Unreal Engine"}
             
-            logger.info(f"Set actor property response: {response}")
+            logger.info("Set actor property response: %s", LogExcerpt(response))
             return response
             
         except Exception as e:
@@ -260,7 +261,7 @@ def register_editor_tools(mcp: FastMCP):
             return {"success": False, "message": error_msg}
 
     # @mcp.tool() commented out because it's buggy
-    def focus_viewport(
+    async def focus_viewport(
         ctx: Context,
         target: str = None,
         location: List[float] = None,
@@ -282,7 +283,7 @@ def register_editor_tools(mcp: FastMCP):
         from unreal_mcp_server import get_unreal_connection
         
         try:
-            unreal = get_unreal_connection()
+            unreal = await asyncio.to_thread(get_unreal_connection)
             if not unreal:
                 logger.error("Failed to connect to Unreal Engine")
                 return {"success": False, "message": "Failed to connect to Unreal Engine"}
@@ -299,15 +300,15 @@ def register_editor_tools(mcp: FastMCP):
             if orientation:
                 params["orientation"] = orientation
                 
-            response = unreal.send_command("focus_viewport", params)
+            response = await asyncio.to_thread(unreal.send_command, "focus_viewport", params)
             return response or {}
             
         except Exception as e:
-            logger.error(f"Error focusing viewport: {e}")
+            logger.error("Error focusing viewport: %s", e)
             return {"status": "error", "message": str(e)}
 
     @mcp.tool()
-    def spawn_blueprint_actor(
+    async def spawn_blueprint_actor(
         ctx: Context,
         blueprint_name: str,
         actor_name: str,
@@ -326,10 +327,10 @@ def register_editor_tools(mcp: FastMCP):
         Returns:
             Dict containing the spawned actor's properties
         """
-        from unreal_mcp_server import get_unreal_connection
+        from unreal_mcp_server import get_unreal_connection, LogExcerpt
         
         try:
-            unreal = get_unreal_connection()
+            unreal = await asyncio.to_thread(get_unreal_connection)
             if not unreal:
                 logger.error("Failed to connect to Unreal Engine")
                 return {"success": False, "message": "Failed to connect to Unreal Engine"}
@@ -346,19 +347,19 @@ def register_editor_tools(mcp: FastMCP):
             for param_name in ["location", "rotation"]:
                 param_value = params[param_name]
                 if not isinstance(param_value, list) or len(param_value) != 3:
-                    logger.error(f"Invalid {param_name} format: {param_value}. Must be a list of 3 float values.")
+                    logger.error("Invalid %s format: %s. Must be a list of 3 float values.", param_name, param_value)
                     return {"success": False, "message": f"Invalid {param_name} format. Must be a list of 3 float values."}
                 # Ensure all values are float
                 params[param_name] = [float(val) for val in param_value]
             
-            logger.info(f"Spawning blueprint actor with params: {params}")
-            response = unreal.send_command("spawn_blueprint_actor", params)
+            logger.info("Spawning blueprint actor with params: %s", params)
+            response = await asyncio.to_thread(unreal.send_command, "spawn_blueprint_actor", params)
             
             if not response:
                 logger.error("No response from Unreal Engine")
                 return {"success": False, "message": "No response from Unreal Engine"}
             
-            logger.info(f"Spawn blueprint actor response: {response}")
+            logger.info("Spawn blueprint actor response: %s", LogExcerpt(response))
             return response
             
         except Exception as e:
@@ -366,4 +367,48 @@ def register_editor_tools(mcp: FastMCP):
             logger.error(error_msg)
             return {"success": False, "message": error_msg}
 
+    @mcp.tool()
+    async def batch_execute(
+        ctx: Context,
+        commands: List[Dict[str, Any]],
+        stop_on_error: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Run several Unreal commands in order with a single round trip.
+        
+        Args:
+            commands: List of {"command": name, "params": {...}} entries, using the
+                      Unreal command names (e.g. spawn_actor, set_actor_transform)
+            stop_on_error: Stop at the first command that fails
+            
+        Returns:
+            Response with the per-command responses, in order, under result.results
+        """
+        from unreal_mcp_server import get_unreal_connection, LogExcerpt
+        
+        try:
+            unreal = await asyncio.to_thread(get_unreal_connection)
+            if not unreal:
+                logger.error("Failed to connect to Unreal Engine")
+                return {"success": False, "message": "Failed to connect to Unreal Engine"}
+            
+            for item in commands:
+                if not isinstance(item, dict) or not item.get("command"):
+                    return {"success": False, "message": "Each batch entry needs a 'command' name"}
+            
+            logger.info("Executing batch of %d commands", len(commands))
+            response = await asyncio.to_thread(unreal.send_batch, commands, stop_on_error)
+            
+            if not response:
+                logger.error("No response from Unreal Engine")
+                return {"success": False, "message": "No response from Unreal Engine"}
+            
+            logger.info("Batch response: %s", LogExcerpt(response))
+            return response
+            
+        except Exception as e:
+            error_msg = f"Error executing batch: {e}"
+            logger.error(error_msg)
+            return {"success": False, "message": error_msg}
+
     logger.info("Editor tools registered successfully")
@@ -4,6 +4,7 @@ Blueprint Node Tools for Unreal MCP.
 This module provides tools for manipulating Blueprint graph nodes and connections.
 """
 
+import asyncio
 import logging
 from typing import Dict, List, Any, Optional
 from mcp.server.fastmcp import FastMCP, Context
@@ -15,7 +16,7 @@ def register_blueprint_node_tools(mcp: FastMCP):
     """Register Blueprint node manipulation tools with the MCP server."""
     
     @mcp.tool()
-    def add_blueprint_event_node(
+    async def add_blueprint_event_node(
         ctx: Context,
         blueprint_name: str,
         event_name: str,
@@ -35,7 +36,7 @@ def register_blueprint_node_tools(mcp: FastMCP):
         Returns:
             Response containing the node ID and success status
         """
-        from unreal_mcp_server import get_unreal_connection
+        from unreal_mcp_server import get_unreal_connection, LogExcerpt
         
         try:
             # Handle default value within the method body
@@ -48,19 +49,19 @@ def register_blueprint_node_tools(mcp: FastMCP):
                 "node_position": node_position
             }
             
-            unreal = get_unreal_connection()
+            unreal = await asyncio.to_thread(get_unreal_connection)
             if not unreal:
                 logger.error("Failed to connect to Unreal Engine")
                 return {"success": False, "message": "Failed to connect to Unreal Engine"}
             
-            logger.info(f"Adding event node '{event_name}' to blueprint '{blueprint_name}'")
-            response = unreal.send_command("add_blueprint_event_node", params)
+            logger.info("Adding event node '%s' to blueprint '%s'", event_name, blueprint_name)
+            response = await asyncio.to_thread(unreal.send_command, "add_blueprint_event_node", params)
             
             if not response:
                 logger.error("No response from Unreal Engine")
                 return {"success": False, "message": "No response from Unreal Engine"}
             
-            logger.info(f"Event node creation response: {response}")
+            logger.info("Event node creation response: %s", LogExcerpt(response))
             return response
             
         except Exception as e:
@@ -69,7 +70,7 @@ def register_blueprint_node_tools(mcp: FastMCP):
             return {"success": False, "message": error_msg}
     
     @mcp.tool()
-    def add_blueprint_input_action_node(
+    async def add_blueprint_input_action_node(
         ctx: Context,
         blueprint_name: str,
         action_name: str,
@@ -86,7 +87,7 @@ def register_blueprint_node_tools(mcp: FastMCP):
         Returns:
             Response containing the node ID and success status
         """
-        from unreal_mcp_server import get_unreal_connection
+        from unreal_mcp_server import get_unreal_connection, LogExcerpt
         
         try:
             # Handle default value within the method body
@@ -99,19 +100,19 @@ def register_blueprint_node_tools(mcp: FastMCP):
                 "node_position": node_position
             }
             
-            unreal = get_unreal_connection()
+            unreal = await asyncio.to_thread(get_unreal_connection)
             if not unreal:
                 logger.error("Failed to connect to Unreal Engine")
                 return {"success": False, "message": "Failed to connect to Unreal Engine"}
             
-            logger.info(f"Adding input action node for '{action_name}' to blueprint '{blueprint_name}'")
-            response = unreal.send_command("add_blueprint_input_action_node", params)
+            logger.info("Adding input action node for '%s' to blueprint '%s'", action_name, blueprint_name)
+            response = await asyncio.to_thread(unreal.send_command, "add_blueprint_input_action_node", params)
             
             if not response:
                 logger.error("No response from Unreal Engine")
                 return {"success": False, "message": "No response from Unreal Engine"}
             
-            logger.info(f"Input action node creation response: {response}")
+            logger.info("Input action node creation response: %s", LogExcerpt(response))
             return response
             
         except Exception as e:
@@ -120,7 +121,7 @@ def register_blueprint_node_tools(mcp: FastMCP):
             return {"success": False, "message": error_msg}
     
     @mcp.tool()
-    def add_blueprint_function_node(
+    async def add_blueprint_function_node(
         ctx: Context,
         blueprint_name: str,
         target: str,
@@ -141,7 +142,7 @@ def register_blueprint_node_tools(mcp: FastMCP):
         Returns:
             Response containing the node ID and success status
         """
-        from unreal_mcp_server import get_unreal_connection
+        from unreal_mcp_server import get_unreal_connection, LogExcerpt
         
         try:
             # Handle default values within the method body
@@ -158,19 +159,19 @@ def register_blueprint_node_tools(mcp: FastMCP):
                 "node_position": node_position
             }
             
-            unreal = get_unreal_connection()
+            unreal = await asyncio.to_thread(get_unreal_connection)
             if not unreal:
                 logger.error("Failed to connect to Unreal Engine")
                 return {"success": False, "message": "Failed to connect to Unreal Engine"}
             
-            logger.info(f"Adding function node '{function_name}' to blueprint '{blueprint_name}'")
-            response = unreal.send_command("add_blueprint_function_node", command_params)
+            logger.info("Adding function node '%s' to blueprint '%s'", function_name, blueprint_name)
+            response = await asyncio.to_thread(unreal.send_command, "add_blueprint_function_node", command_params)
             
             if not response:
                 logger.error("No response from Unreal Engine")
                 return {"success": False, "message": "No response from Unreal Engine"}
             
-            logger.info(f"Function node creation response: {response}")
+            logger.info("Function node creation response: %s", LogExcerpt(response))
             return response
             
         except Exception as e:
@@ -179,7 +180,7 @@ def register_blueprint_node_tools(mcp: FastMCP):
             return {"success": False, "message": error_msg}
             
     @mcp.tool()
-    def connect_blueprint_nodes(
+    async def connect_blueprint_nodes(
         ctx: Context,
         blueprint_name: str,
         source_node_id: str,
@@ -200,7 +201,7 @@ def register_blueprint_node_tools(mcp: FastMCP):
         Returns:
             Response indicating success or failure
         """
-        from unreal_mcp_server import get_unreal_connection
+        from unreal_mcp_server import get_unreal_connection, LogExcerpt
         
         try:
             params = {
@@ -211,19 +212,19 @@ def register_blueprint_node_tools(mcp: FastMCP):
                 "target_pin": target_pin
             }
             
-            unreal = get_unreal_connection()
+            unreal = await asyncio.to_thread(get_unreal_connection)
             if not unreal:
                 logger.error("Failed to connect to Unreal Engine")
                 return {"success": False, "message": "Failed to connect to Unreal Engine"}
             
-            logger.info(f"Connecting nodes in blueprint '{blueprint_name}'")
-            response = unreal.send_command("connect_blueprint_nodes", params)
+            logger.info("Connecting nodes in blueprint '%s'", blueprint_name)
+            response = await asyncio.to_thread(unreal.send_command, "connect_blueprint_nodes", params)
             
             if not response:
                 logger.error("No response from Unreal Engine")
                 return {"success": False, "message": "No response from Unreal Engine"}
             
-            logger.info(f"Node connection response: {response}")
+            logger.info("Node connection response: %s", LogExcerpt(response))
             return response
             
         except Exception as e:
@@ -232,7 +233,7 @@ def register_blueprint_node_tools(mcp: FastMCP):
             return {"success": False, "message": error_msg}
     
     @mcp.tool()
-    def add_blueprint_variable(
+    async def add_blueprint_variable(
         ctx: Context,
         blueprint_name: str,
         variable_name: str,
@@ -251,7 +252,7 @@ def register_blueprint_node_tools(mcp: FastMCP):
         Returns:
             Response indicating success or failure
         """
-        from unreal_mcp_server import get_unreal_connection
+        from unreal_mcp_server import get_unreal_connection, LogExcerpt
         
         try:
             params = {
@@ -261,19 +262,19 @@ def register_blueprint_node_tools(mcp: FastMCP):
                 "is_exposed": is_exposed
             }
             
-            unreal = get_unreal_connection()
+            unreal = await asyncio.to_thread(get_unreal_connection)
             if not unreal:
                 logger.error("Failed to connect to Unreal Engine")
                 return {"success": False, "message": "Failed to connect to Unreal Engine"}
             
-            logger.info(f"Adding variable '{variable_name}' to blueprint '{blueprint_name}'")
-            response = unreal.send_command("add_blueprint_variable", params)
+            logger.info("Adding variable '%s' to blueprint '%s'", variable_name, blueprint_name)
+            response = await asyncio.to_thread(unreal.send_command, "add_blueprint_variable", params)
             
             if not response:
                 logger.error("No response from Unreal Engine")
                 return {"success": False, "message": "No response from Unreal Engine"}
             
-            logger.info(f"Variable creation response: {response}")
+            logger.info("Variable creation response: %s", LogExcerpt(response))
             return response
             
         except Exception as e:
@@ -282,7 +283,7 @@ def register_blueprint_node_tools(mcp: FastMCP):
             return {"success": False, "message": error_msg}
     
     @mcp.tool()
-    def add_blueprint_get_self_component_reference(
+    async def add_blueprint_get_self_component_reference(
         ctx: Context,
         blueprint_name: str,
         component_name: str,
@@ -300,7 +301,7 @@ def register_blueprint_node_tools(mcp: FastMCP):
         Returns:
             Response containing the node ID and success status
         """
-        from unreal_mcp_server import get_unreal_connection
+        from unreal_mcp_server import get_unreal_connection, LogExcerpt
         
         try:
             # Handle None case explicitly in the function
@@ -313,19 +314,19 @@ def register_blueprint_node_tools(mcp: FastMCP):
                 "node_position": node_position
             }
             
-            unreal = get_unreal_connection()
+            unreal = await asyncio.to_thread(get_unreal_connection)
             if not unreal:
                 logger.error("Failed to connect to Unreal Engine")
                 return {"success": False, "message": "Failed to connect to Unreal Engine"}
             
-            logger.info(f"Adding self component reference node for '{component_name}' to blueprint '{blueprint_name}'")
-            response = unreal.send_command("add_blueprint_get_self_component_reference", params)
+            logger.info("Adding self component reference node for '%s' to blueprint '%s'", component_name, blueprint_name)
+            response = await asyncio.to_thread(unreal.send_command, "add_blueprint_get_self_component_reference", params)
             
             if not response:
                 logger.error("No response from Unreal Engine")
                 return {"success": False, "message": "No response from Unreal Engine"}
             
-            logger.info(f"Self component reference node creation response: {response}")
+            logger.info("Self component reference node creation response: %s", LogExcerpt(response))
             return response
             
         except Exception as e:
@@ -334,7 +335,7 @@ def register_blueprint_node_tools(mcp: FastMCP):
             return {"success": False, "message": error_msg}
     
     @mcp.tool()
-    def add_blueprint_self_reference(
+    async def add_blueprint_self_reference(
         ctx: Context,
         blueprint_name: str,
         node_position = None
@@ -349,7 +350,7 @@ def register_blueprint_node_tools(mcp: FastMCP):
         Returns:
             Response containing the node ID and success status
         """
-        from unreal_mcp_server import get_unreal_connection
+        from unreal_mcp_server import get_unreal_connection, LogExcerpt
         
         try:
             if node_position is None:
@@ -360,19 +361,19 @@ def register_blueprint_node_tools(mcp: FastMCP):
                 "node_position": node_position
             }
             
-            unreal = get_unreal_connection()
+            unreal = await asyncio.to_thread(get_unreal_connection)
             if not unreal:
                 logger.error("Failed to connect to Unreal Engine")
                 return {"success": False, "message": "Failed to connect to Unreal Engine"}
             
-            logger.info(f"Adding self reference node to blueprint '{blueprint_name}'")
-            response = unreal.send_command("add_blueprint_self_reference", params)
+            logger.info("Adding self reference node to blueprint '%s'", blueprint_name)
+            response = await asyncio.to_thread(unreal.send_command, "add_blueprint_self_reference", params)
             
             if not response:
                 logger.error("No response from Unreal Engine")
                 return {"success": False, "message": "No response from Unreal Engine"}
             
-            logger.info(f"Self reference node creation response: {response}")
+            logger.info("Self reference node creation response: %s", LogExcerpt(response))
             return response
             
         except Exception as e:
@@ -381,7 +382,7 @@ def register_blueprint_node_tools(mcp: FastMCP):
             return {"success": False, "message": error_msg}
     
     @mcp.tool()
-    def find_blueprint_nodes(
+    async def find_blueprint_nodes(
         ctx: Context,
         blueprint_name: str,
         node_type = None,
@@ -398,7 +399,7 @@ def register_blueprint_node_tools(mcp: FastMCP):
         Returns:
             Response containing array of found node IDs and success status
         """
-        from unreal_mcp_server import get_unreal_connection
+        from unreal_mcp_server import get_unreal_connection, LogExcerpt
         
         try:
             params = {
@@ -407,19 +408,19 @@ def register_blueprint_node_tools(mcp: FastMCP):
                 "event_type": event_type
             }
             
-            unreal = get_unreal_connection()
+            unreal = await asyncio.to_thread(get_unreal_connection)
             if not unreal:
                 logger.error("Failed to connect to Unreal Engine")
                 return {"success": False, "message": "Failed to connect to Unreal Engine"}
             
-            logger.info(f"Finding nodes in blueprint '{blueprint_name}'")
-            response = unreal.send_command("find_blueprint_nodes", params)
+            logger.info("Finding nodes in blueprint '%s'", blueprint_name)
+            response = await asyncio.to_thread(unreal.send_command, "find_blueprint_nodes", params)
             
             if not response:
                 logger.error("No response from Unreal Engine")
                 return {"success": False, "message": "No response from Unreal Engine"}
             
-            logger.info(f"Node find response: {response}")
+            logger.info("Node find response: %s", LogExcerpt(response))
             return response
             
         except Exception as e:
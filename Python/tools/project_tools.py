@@ -4,6 +4,7 @@ Project Tools for Unreal MCP.
 This module provides tools for managing project-wide settings and configuration.
 """
 
+import asyncio
 import logging
 from typing import Dict, Any
 from mcp.server.fastmcp import FastMCP, Context
@@ -15,7 +16,7 @@ def register_project_tools(mcp: FastMCP):
     """Register project tools with the MCP server."""
     
     @mcp.tool()
-    def create_input_mapping(
+    async def create_input_mapping(
         ctx: Context,
         action_name: str,
         key: str,
@@ -32,10 +33,10 @@ def register_project_tools(mcp: FastMCP):
         Returns:
             Response indicating success or failure
         """
-        from unreal_mcp_server import get_unreal_connection
+        from unreal_mcp_server import get_unreal_connection, LogExcerpt
         
         try:
-            unreal = get_unreal_connection()
+            unreal = await asyncio.to_thread(get_unreal_connection)
             if not unreal:
                 logger.error("Failed to connect to Unreal Engine")
                 return {"success": False, "message": "Failed to connect to Unreal Engine"}
@@ -46,14 +47,14 @@ def register_project_tools(mcp: FastMCP):
                 "input_type": input_type
             }
             
-            logger.info(f"Creating input mapping '{action_name}' with key '{key}'")
-            response = unreal.send_command("create_input_mapping", params)
+            logger.info("Creating input mapping '%s' with key '%s'", action_name, key)
+            response = await asyncio.to_thread(unreal.send_command, "create_input_mapping", params)
             
             if not response:
                 logger.error("No response from Unreal Engine")
                 return {"success": False, "message": "No response from Unreal Engine"}
             
-            logger.info(f"Input mapping creation response: {response}")
+            logger.info("Input mapping creation response: %s", LogExcerpt(response))
             return response
             
         except Exception as e:
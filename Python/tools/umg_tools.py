@@ -4,6 +4,7 @@ UMG Tools for Unreal MCP.
 This module provides tools for creating and manipulating UMG Widget Blueprints in Unreal Engine.
 """
 
+import asyncio
 import logging
 from typing import Dict, List, Any
 from mcp.server.fastmcp import FastMCP, Context
@@ -15,7 +16,7 @@ def register_umg_tools(mcp: FastMCP):
     """Register UMG tools with the MCP server."""
 
     @mcp.tool()
-    def create_umg_widget_blueprint(
+    async def create_umg_widget_blueprint(
         ctx: Context,
         widget_name: str,
         parent_class: str = "UserWidget",
@@ -32,10 +33,10 @@ def register_umg_tools(mcp: FastMCP):
         Returns:
             Dict containing success status and widget path
         """
-        from unreal_mcp_server import get_unreal_connection
+        from unreal_mcp_server import get_unreal_connection, LogExcerpt
         
         try:
-            unreal = get_unreal_connection()
+            unreal = await asyncio.to_thread(get_unreal_connection)
             if not unreal:
                 logger.error("Failed to connect to Unreal Engine")
                 return {"success": False, "message": "Failed to connect to Unreal Engine"}
@@ -46,14 +47,14 @@ def register_umg_tools(mcp: FastMCP):
                 "path": path
             }
             
-            logger.info(f"Creating UMG Widget Blueprint with params: {params}")
-            response = unreal.send_command("create_umg_widget_blueprint", params)
+            logger.info("Creating UMG Widget Blueprint with params: %s", params)
+            response = await asyncio.to_thread(unreal.send_command, "create_umg_widget_blueprint", params)
             
             if not response:
                 logger.error("No response from Unreal Engine")
                 return {"success": False, "message": "No response from Unreal Engine"}
             
-            logger.info(f"Create UMG Widget Blueprint response: {response}")
+            logger.info("Create UMG Widget Blueprint response: %s", LogExcerpt(response))
             return response
             
         except Exception as e:
@@ -62,7 +63,7 @@ def register_umg_tools(mcp: FastMCP):
             return {"success": False, "message": error_msg}
 
     @mcp.tool()
-    def add_text_block_to_widget(
+    async def add_text_block_to_widget(
         ctx: Context,
         widget_name: str,
         text_block_name: str,
@@ -87,10 +88,10 @@ def register_umg_tools(mcp: FastMCP):
         Returns:
             Dict containing success status and text block properties
         """
-        from unreal_mcp_server import get_unreal_connection
+        from unreal_mcp_server import get_unreal_connection, LogExcerpt
         
         try:
-            unreal = get_unreal_connection()
+            unreal = await asyncio.to_thread(get_unreal_connection)
             if not unreal:
                 logger.error("Failed to connect to Unreal Engine")
                 return {"success": False, "message": "Failed to connect to Unreal Engine"}
@@ -105,14 +106,14 @@ def register_umg_tools(mcp: FastMCP):
                 "color": color
             }
             
-            logger.info(f"Adding Text Block to widget with params: {params}")
-            response = unreal.send_command("add_text_block_to_widget", params)
+            logger.info("Adding Text Block to widget with params: %s", params)
+            response = await asyncio.to_thread(unreal.send_command, "add_text_block_to_widget", params)
             
             if not response:
                 logger.error("No response from Unreal Engine")
                 return {"success": False, "message": "No response from Unreal Engine"}
             
-            logger.info(f"Add Text Block response: {response}")
+            logger.info("Add Text Block response: %s", LogExcerpt(response))
             return response
             
         except Exception as e:
@@ -121,7 +122,7 @@ def register_umg_tools(mcp: FastMCP):
             return {"success": False, "message": error_msg}
 
     @mcp.tool()
-    def add_button_to_widget(
+    async def add_button_to_widget(
         ctx: Context,
         widget_name: str,
         button_name: str,
@@ -148,10 +149,10 @@ def register_umg_tools(mcp: FastMCP):
         Returns:
             Dict containing success status and button properties
         """
-        from unreal_mcp_server import get_unreal_connection
+        from unreal_mcp_server import get_unreal_connection, LogExcerpt
         
         try:
-            unreal = get_unreal_connection()
+            unreal = await asyncio.to_thread(get_unreal_connection)
             if not unreal:
                 logger.error("Failed to connect to Unreal Engine")
                 return {"success": False, "message": "Failed to connect to Unreal Engine"}
@@ -167,14 +168,14 @@ def register_umg_tools(mcp: FastMCP):
                 "background_color": background_color
             }
             
-            logger.info(f"Adding Button to widget with params: {params}")
-            response = unreal.send_command("add_button_to_widget", params)
+            logger.info("Adding Button to widget with params: %s", params)
+            response = await asyncio.to_thread(unreal.send_command, "add_button_to_widget", params)
             
             if not response:
                 logger.error("No response from Unreal Engine")
                 return {"success": False, "message": "No response from Unreal Engine"}
             
-            logger.info(f"Add Button response: {response}")
+            logger.info("Add Button response: %s", LogExcerpt(response))
             return response
             
         except Exception as e:
@@ -183,7 +184,7 @@ def register_umg_tools(mcp: FastMCP):
             return {"success": False, "message": error_msg}
 
     @mcp.tool()
-    def bind_widget_event(
+    async def bind_widget_event(
         ctx: Context,
         widget_name: str,
         widget_component_name: str,
@@ -202,10 +203,10 @@ def register_umg_tools(mcp: FastMCP):
         Returns:
             Dict containing success status and binding information
         """
-        from unreal_mcp_server import get_unreal_connection
+        from unreal_mcp_server import get_unreal_connection, LogExcerpt
         
         try:
-            unreal = get_unreal_connection()
+            unreal = await asyncio.to_thread(get_unreal_connection)
             if not unreal:
                 logger.error("Failed to connect to Unreal Engine")
                 return {"success": False, "message": "Failed to connect to Unreal Engine"}
@@ -221,14 +222,14 @@ def register_umg_tools(mcp: FastMCP):
                 "function_name": function_name
             }
             
-            logger.info(f"Binding widget event with params: {params}")
-            response = unreal.send_command("bind_widget_event", params)
+            logger.info("Binding widget event with params: %s", params)
+            response = await asyncio.to_thread(unreal.send_command, "bind_widget_event", params)
             
             if not response:
                 logger.error("No response from Unreal Engine")
                 return {"success": False, "message": "No response from Unreal Engine"}
             
-            logger.info(f"Bind widget event response: {response}")
+            logger.info("Bind widget event response: %s", LogExcerpt(response))
             return response
             
         except Exception as e:
@@ -237,7 +238,7 @@ def register_umg_tools(mcp: FastMCP):
             return {"success": False, "message": error_msg}
 
     @mcp.tool()
-    def add_widget_to_viewport(
+    async def add_widget_to_viewport(
         ctx: Context,
         widget_name: str,
         z_order: int = 0
@@ -252,10 +253,10 @@ def register_umg_tools(mcp: FastMCP):
         Returns:
             Dict containing success status and widget instance information
         """
-        from unreal_mcp_server import get_unreal_connection
+        from unreal_mcp_server import get_unreal_connection, LogExcerpt
         
         try:
-            unreal = get_unreal_connection()
+            unreal = await asyncio.to_thread(get_unreal_connection)
             if not unreal:
                 logger.error("Failed to connect to Unreal Engine")
                 return {"success": False, "message": "Failed to connect to Unreal Engine"}
@@ -265,14 +266,14 @@ def register_umg_tools(mcp: FastMCP):
                 "z_order": z_order
             }
             
-            logger.info(f"Adding widget to viewport with params: {params}")
-            response = unreal.send_command("add_widget_to_viewport", params)
+            logger.info("Adding widget to viewport with params: %s", params)
+            response = await asyncio.to_thread(unreal.send_command, "add_widget_to_viewport", params)
             
             if not response:
                 logger.error("No response from Unreal Engine")
                 return {"success": False, "message": "No response from Unreal Engine"}
             
-            logger.info(f"Add widget to viewport response: {response}")
+            logger.info("Add widget to viewport response: %s", LogExcerpt(response))
             return response
             
         except Exception as e:
@@ -281,7 +282,7 @@ def register_umg_tools(mcp: FastMCP):
             return {"success": False, "message": error_msg}
 
     @mcp.tool()
-    def set_text_block_binding(
+    async def set_text_block_binding(
         ctx: Context,
         widget_name: str,
         text_block_name: str,
@@ -300,10 +301,10 @@ def register_umg_tools(mcp: FastMCP):
         Returns:
             Dict containing success status and binding information
         """
-        from unreal_mcp_server import get_unreal_connection
+        from unreal_mcp_server import get_unreal_connection, LogExcerpt
         
         try:
-            unreal = get_unreal_connection()
+            unreal = await asyncio.to_thread(get_unreal_connection)
             if not unreal:
                 logger.error("Failed to connect to Unreal Engine")
                 return {"success": False, "message": "Failed to connect to Unreal Engine"}
@@ -315,14 +316,14 @@ def register_umg_tools(mcp: FastMCP):
                 "binding_type": binding_type
             }
             
-            logger.info(f"Setting text block binding with params: {params}")
-            response = unreal.send_command("set_text_block_binding", params)
+            logger.info("Setting text block binding with params: %s", params)
+            response = await asyncio.to_thread(unreal.send_command, "set_text_block_binding", params)
             
             if not response:
                 logger.error("No response from Unreal Engine")
                 return {"success": False, "message": "No response from Unreal Engine"}
             
-            logger.info(f"Set text block binding response: {response}")
+            logger.info("Set text block binding response: %s", LogExcerpt(response))
             return response
             
         except Exception as e:
@@ -4,28 +4,107 @@ Unreal Engine MCP Server
 A simple MCP server for interacting with Unreal Engine.
 """
 
+import asyncio
+import atexit
 import logging
+import os
+import queue
 import socket
 import sys
 import json
+import threading
+import time
 from contextlib import asynccontextmanager
-from typing import AsyncIterator, Dict, Any, Optional
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import AsyncIterator, Dict, Any, List, Optional
 from mcp.server.fastmcp import FastMCP
 
 # Configure logging with more detailed format
+# Set UNREAL_MCP_LOG_LEVEL=DEBUG for more details
+_log_level_setting = (os.getenv("UNREAL_MCP_LOG_LEVEL") or "INFO").strip().upper()
+if _log_level_setting.isdigit():
+    LOG_LEVEL = int(_log_level_setting)
+elif isinstance(logging.getLevelName(_log_level_setting), int):
+    LOG_LEVEL = _log_level_setting
+else:
+    # Unknown names would make basicConfig raise at import; warn once logging is up
+    LOG_LEVEL = "INFO"
+# Longest excerpt of a command or response payload logged at INFO; full payloads
+# are only logged at DEBUG
+LOG_PAYLOAD_CHARS = 500
+# Records are queued and written to the file by a listener thread, so logging
+# from tools and the event loop never waits on disk writes. The file is rotated
+# so long sessions that log every payload don't grow it without bound.
+_log_queue = queue.SimpleQueue()
+_log_listener = QueueListener(
+    _log_queue,
+    RotatingFileHandler('unreal_mcp.log', maxBytes=10 * 1024 * 1024, backupCount=3, delay=True),
+    # logging.StreamHandler(sys.stdout) # Remove this handler to unexpected non-whitespace characters in JSON
+)
 logging.basicConfig(
-    level=logging.DEBUG,  # Change to DEBUG level for more details
+    level=LOG_LEVEL,
     format='%(asctime)s - %(name)s - %(levelname)s - [%(filename)s:%(lineno)d] - %(message)s',
-    handlers=[
-        logging.FileHandler('unreal_mcp.log'),
-        # logging.StreamHandler(sys.stdout) # Remove this handler to unexpected non-whitespace characters in JSON
-    ]
+    handlers=[QueueHandler(_log_queue)]
 )
+_log_listener.start()
+atexit.register(_log_listener.stop)
 logger = logging.getLogger("UnrealMCP")
+if LOG_LEVEL == "INFO" and _log_level_setting != "INFO":
+    logger.warning("Unknown UNREAL_MCP_LOG_LEVEL %r, using INFO", _log_level_setting)
 
 # Configuration
 UNREAL_HOST = "127.0.0.1"
 UNREAL_PORT = 55557
+# Idle time after which the kept-alive socket is released. Unreal serves one
+# client at a time, so holding it forever would lock out other clients.
+UNREAL_KEEPALIVE_SECONDS = 5.0
+# Read-only commands whose successful responses are reused for a short time.
+# Any other command may change the level and clears the cache.
+UNREAL_CACHED_COMMANDS = frozenset({
+    "get_actors_in_level",
+    "find_actors_by_name",
+    "get_actor_properties",
+    "find_blueprint_nodes",
+})
+UNREAL_CACHE_SECONDS = 2.0
+UNREAL_CACHE_SIZE = 128
+# The plugin reads each command with a single Recv into an 8 KB buffer, so a
+# request must encode to at most this many bytes to arrive in one piece
+UNREAL_MAX_COMMAND_BYTES = 8191
+# Seconds to wait for one command's response; batch_execute runs all of its
+# entries in a single game-thread task, so batches wait this long per entry
+UNREAL_RESPONSE_TIMEOUT = 5.0
+# Upper bound for a whole batch_execute request. The wait holds the connection
+# lock, so a stalled game thread must not block every other caller for long
+UNREAL_MAX_BATCH_TIMEOUT = 60.0
+
+# Built once: json.dumps() with non-default options creates a new encoder per call.
+# Commands are sent without whitespace; cache keys also sort params.
+_command_encoder = json.JSONEncoder(separators=(',', ':'))
+_cache_key_encoder = json.JSONEncoder(separators=(',', ':'), sort_keys=True)
+
+class LogExcerpt:
+    """Log argument rendering at most `limit` characters of a value's JSON.
+
+    Encoding is incremental and stops at the limit, and only happens if the
+    record is actually emitted, so large responses cost O(limit) to log.
+    """
+
+    _encoder = json.JSONEncoder(default=str)
+
+    def __init__(self, value: Any, limit: int = LOG_PAYLOAD_CHARS):
+        self.value = value
+        self.limit = limit
+
+    def __str__(self) -> str:
+        parts = []
+        size = 0
+        for chunk in self._encoder.iterencode(self.value):
+            parts.append(chunk)
+            size += len(chunk)
+            if size > self.limit:
+                return ''.join(parts)[:self.limit] + '...'
+        return ''.join(parts)
 
 class UnrealConnection:
     """Connection to an Unreal Engine instance."""
@@ -34,6 +113,10 @@ class UnrealConnection:
         """Initialize the connection."""
         self.socket = None
         self.connected = False
+        self._lock = threading.RLock()
+        self._idle_timer = None
+        self._last_used = 0.0
+        self._cache = {}
     
     def connect(self) -> bool:
         """Connect to the Unreal Engine instance."""
@@ -46,7 +129,7 @@ class UnrealConnection:
                     pass
                 self.socket = None
             
-            logger.info(f"Connecting to Unreal at {UNREAL_HOST}:{UNREAL_PORT}...")
+            logger.info("Connecting to Unreal at %s:%s...", UNREAL_HOST, UNREAL_PORT)
             self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             self.socket.settimeout(5)  # 5 second timeout
             
@@ -60,52 +143,109 @@ class UnrealConnection:
             
             self.socket.connect((UNREAL_HOST, UNREAL_PORT))
             self.connected = True
+            self._last_used = time.monotonic()
+            self._arm_idle_release(UNREAL_KEEPALIVE_SECONDS)
             logger.info("Connected to Unreal Engine")
             return True
             
         except Exception as e:
-            logger.error(f"Failed to connect to Unreal: {e}")
+            logger.error("Failed to connect to Unreal: %s", e)
             self.connected = False
             return False
     
     def disconnect(self):
         """Disconnect from the Unreal Engine instance."""
-        if self.socket:
+        with self._lock:
+            if self._idle_timer:
+                self._idle_timer.cancel()
+                self._idle_timer = None
+            if self.socket:
+                try:
+                    self.socket.close()
+                except:
+                    pass
+            self.socket = None
+            self.connected = False
+
+    def ensure_connected(self) -> bool:
+        """Connect unless the kept-alive socket is already open."""
+        with self._lock:
+            return self.connected or self.connect()
+
+    def _arm_idle_release(self, delay: float):
+        """Start the idle-release timer unless one is already pending."""
+        with self._lock:
+            if self._idle_timer is None:
+                self._idle_timer = threading.Timer(delay, self._release_if_idle)
+                self._idle_timer.daemon = True
+                self._idle_timer.start()
+
+    def _release_if_idle(self):
+        """Close the kept-alive socket so other clients can reach the editor."""
+        with self._lock:
+            self._idle_timer = None
+            if not self.connected:
+                return
+            idle = time.monotonic() - self._last_used
+            if idle >= UNREAL_KEEPALIVE_SECONDS:
+                logger.debug("Releasing idle Unreal connection")
+                self.disconnect()
+            else:
+                # Used since the timer was armed: check again once it can have been idle long enough
+                self._arm_idle_release(UNREAL_KEEPALIVE_SECONDS - idle)
+
+    def _peer_closed(self) -> bool:
+        """Return True if Unreal has closed the kept-alive socket since it was last used."""
+        # A non-blocking peek reads b'' (or fails) once the peer has closed the
+        # connection, and raises BlockingIOError while it is open and idle
+        try:
+            self.socket.setblocking(False)
             try:
-                self.socket.close()
-            except:
-                pass
-        self.socket = None
-        self.connected = False
+                return self.socket.recv(1, socket.MSG_PEEK) == b''
+            finally:
+                self.socket.settimeout(UNREAL_RESPONSE_TIMEOUT)
+        except BlockingIOError:
+            return False
+        except OSError:
+            return True
 
-    def receive_full_response(self, sock, buffer_size=4096) -> bytes:
-        """Receive a complete response from Unreal, handling chunked data."""
+    def receive_full_response(self, sock, buffer_size=65536, timeout: float = UNREAL_RESPONSE_TIMEOUT) -> Dict[str, Any]:
+        """Receive a complete response from Unreal, handling chunked data, and return it decoded."""
         chunks = []
-        sock.settimeout(5)  # 5 second timeout
+        sock.settimeout(timeout)
         try:
             while True:
                 chunk = sock.recv(buffer_size)
                 if not chunk:
                     if not chunks:
-                        raise Exception("Connection closed before receiving data")
+                        raise ConnectionError("Connection closed before receiving data")
                     break
                 chunks.append(chunk)
-                
+
+                # A complete response is a JSON object, so it must end with '}'.
+                # Skip joining and re-parsing the whole buffer until it does.
+                tail = chunk.rstrip()
+                if tail and not tail.endswith(b'}'):
+                    logger.debug("Received partial response, waiting for more data...")
+                    continue
+
                 # Process the data received so far
                 data = b''.join(chunks)
-                decoded_data = data.decode('utf-8')
                 
-                # Try to parse as JSON to check if complete
+                # Try to parse as JSON to check if complete; json.loads takes the
+                # UTF-8 bytes directly and the result is returned, not re-parsed
                 try:
-                    json.loads(decoded_data)
-                    logger.info(f"Received complete response ({len(data)} bytes)")
-                    return data
+                    response = json.loads(data)
+                    if logger.isEnabledFor(logging.INFO):
+                        logger.info("Received complete response (%d bytes): %s", len(data),
+                                    data[:LOG_PAYLOAD_CHARS].decode('utf-8', 'replace'))
+                    return response
                 except json.JSONDecodeError:
                     # Not complete JSON yet, continue reading
-                    logger.debug(f"Received partial response, waiting for more data...")
+                    logger.debug("Received partial response, waiting for more data...")
                     continue
                 except Exception as e:
-                    logger.warning(f"Error processing response chunk: {str(e)}")
+                    logger.warning("Error processing response chunk: %s", e)
                     continue
         except socket.timeout:
             logger.warning("Socket timeout during receive")
@@ -113,29 +253,121 @@ class UnrealConnection:
                 # If we have some data already, try to use it
                 data = b''.join(chunks)
                 try:
-                    json.loads(data.decode('utf-8'))
-                    logger.info(f"Using partial response after timeout ({len(data)} bytes)")
-                    return data
+                    response = json.loads(data)
+                    logger.info("Using partial response after timeout (%d bytes)", len(data))
+                    return response
                 except:
                     pass
             raise Exception("Timeout receiving Unreal response")
         except Exception as e:
-            logger.error(f"Error during receive: {str(e)}")
+            logger.error("Error during receive: %s", e)
             raise
     
-    def send_command(self, command: str, params: Dict[str, Any] = None) -> Optional[Dict[str, Any]]:
+    def send_command(self, command: str, params: Dict[str, Any] = None,
+                     timeout: float = UNREAL_RESPONSE_TIMEOUT) -> Optional[Dict[str, Any]]:
         """Send a command to Unreal Engine and get the response."""
-        # Always reconnect for each command, since Unreal closes the connection after each command
-        # This is different from Unity which keeps connections alive
-        if self.socket:
+        with self._lock:
+            cache_key = None
+            if command in UNREAL_CACHED_COMMANDS:
+                cache_key = (command, _cache_key_encoder.encode(params or {}))
+                cached = self._cache.get(cache_key)
+                if cached and time.monotonic() - cached[0] < UNREAL_CACHE_SECONDS:
+                    logger.debug("Using cached response for %s", command)
+                    return cached[1]
+            else:
+                self._cache.clear()
+
             try:
-                self.socket.close()
-            except:
-                pass
-            self.socket = None
+                response = self._send_command(command, params, timeout)
+            finally:
+                self._last_used = time.monotonic()
+
+            if cache_key and response and response.get("status") != "error":
+                self._cache.pop(cache_key, None)
+                self._cache[cache_key] = (time.monotonic(), response)
+                if len(self._cache) > UNREAL_CACHE_SIZE:
+                    del self._cache[next(iter(self._cache))]
+            return response
+
+    def send_batch(self, commands: List[Dict[str, Any]], stop_on_error: bool = False) -> Optional[Dict[str, Any]]:
+        """Run several commands in as few round trips as the plugin's request size allows.
+
+        Each entry is {"command": name, "params": {...}}. On success the per-command
+        responses are returned in order under result["results"].
+        """
+        results = []
+        sent = 0
+        for chunk in self._split_batch(commands, stop_on_error):
+            # A single command gains nothing from the batch wrapper, and sending it
+            # directly lets read-only commands use the response cache
+            if len(chunk) == 1:
+                chunk_results = self._send_each(chunk, stop_on_error)["result"]["results"]
+            else:
+                response = self.send_command("batch_execute", {"commands": chunk, "stopOnError": stop_on_error},
+                                             timeout=min(UNREAL_RESPONSE_TIMEOUT * len(chunk), UNREAL_MAX_BATCH_TIMEOUT))
+                if response and "Unknown command" in str(response.get("error", "")):
+                    # Plugin builds without batch_execute: fall back to one command per round trip
+                    logger.info("batch_execute not supported by Unreal, sending %d commands one by one",
+                                len(commands) - sent)
+                    results.extend(self._send_each(commands[sent:], stop_on_error)["result"]["results"])
+                    break
+                if not response or response.get("status") == "error":
+                    if not results:
+                        return response
+                    # Earlier requests were applied; report them along with the failure
+                    error = response.get("error") if response else "No response from Unreal Engine"
+                    return {"status": "error", "error": error, "result": {"results": results}}
+                chunk_results = response["result"]["results"]
+
+            results.extend(chunk_results)
+            sent += len(chunk)
+            if stop_on_error and any(result.get("status") == "error" for result in chunk_results):
+                break
+        return {"status": "success", "result": {"results": results}}
+
+    def _split_batch(self, commands: List[Dict[str, Any]], stop_on_error: bool) -> List[List[Dict[str, Any]]]:
+        """Group batch entries into batch_execute requests that each fit in UNREAL_MAX_COMMAND_BYTES."""
+        envelope = len(_command_encoder.encode(
+            {"type": "batch_execute", "params": {"commands": [], "stopOnError": stop_on_error}}))
+        chunks = []
+        chunk = []
+        size = envelope
+        for item in commands:
+            # Encoded output is ASCII, so its length is the byte count; +1 for the comma
+            item_size = len(_command_encoder.encode(item)) + 1
+            if chunk and size + item_size > UNREAL_MAX_COMMAND_BYTES:
+                chunks.append(chunk)
+                chunk = []
+                size = envelope
+            chunk.append(item)
+            size += item_size
+        if chunk:
+            chunks.append(chunk)
+        return chunks
+
+    def _send_each(self, commands: List[Dict[str, Any]], stop_on_error: bool) -> Dict[str, Any]:
+        """Send batch entries as individual commands, returning a batch-shaped response."""
+        results = []
+        for item in commands:
+            result = self.send_command(item["command"], item.get("params"))
+            results.append(result or {"status": "error", "error": "No response from Unreal Engine"})
+            if stop_on_error and results[-1].get("status") == "error":
+                break
+        return {"status": "success", "result": {"results": results}}
+
+    def _send_command(self, command: str, params: Dict[str, Any] = None,
+                      timeout: float = UNREAL_RESPONSE_TIMEOUT) -> Optional[Dict[str, Any]]:
+        """Send a command over the kept-alive socket, connecting first if needed."""
+        # Unreal keeps the client socket open between commands, so reuse it
+        # instead of paying a new connect + accept for every command
+        reused = self.connected
+        if reused and self._peer_closed():
+            # Unreal dropped the kept-alive socket (e.g. editor restart) while idle;
+            # nothing has been sent on it yet, so a fresh connection is safe
+            logger.warning("Reused connection was closed by Unreal, reconnecting")
+            reused = False
             self.connected = False
-        
-        if not self.connect():
+        if not reused and not self.connect():
             logger.error("Failed to connect to Unreal Engine for command")
             return None
         
@@ -147,47 +379,48 @@ class UnrealConnection:
             }
             
             # Send without newline, exactly like Unity
-            command_json = json.dumps(command_obj)
-            logger.info(f"Sending command: {command_json}")
-            self.socket.sendall(command_json.encode('utf-8'))
-            
-            # Read response using improved handler
-            response_data = self.receive_full_response(self.socket)
-            response = json.loads(response_data.decode('utf-8'))
+            command_json = _command_encoder.encode(command_obj)
+            logger.info("Sending command: %.*s", LOG_PAYLOAD_CHARS, command_json)
+            payload = command_json.encode('utf-8')
+            try:
+                self.socket.sendall(payload)
+                # Read response using improved handler
+                response = self.receive_full_response(self.socket, timeout=timeout)
+            except ConnectionError as e:
+                # The command may already have run before the socket closed, so
+                # only read-only commands are safe to send a second time
+                if not reused or command not in UNREAL_CACHED_COMMANDS:
+                    raise
+                logger.warning("Reused connection was closed (%s), reconnecting", e)
+                if not self.connect():
+                    raise
+                self.socket.sendall(payload)
+                response = self.receive_full_response(self.socket, timeout=timeout)
             
             # Log complete response for debugging
-            logger.info(f"Complete response from Unreal: {response}")
+            logger.debug("Complete response from Unreal: %s", response)
             
             # Check for both error formats: {"status": "error", ...} and {"success": false, ...}
             if response.get("status") == "error":
                 error_message = response.get("error") or response.get("message", "Unknown Unreal error")
-                logger.error(f"Unreal error (status=error): {error_message}")
+                logger.error("Unreal error (status=error): %s", error_message)
                 # We want to preserve the original error structure but ensure error is accessible
                 if "error" not in response:
                     response["error"] = error_message
             elif response.get("success") is False:
                 # This format uses {"success": false, "error": "message"} or {"success": false, "message": "message"}
                 error_message = response.get("error") or response.get("message", "Unknown Unreal error")
-                logger.error(f"Unreal error (success=false): {error_message}")
+                logger.error("Unreal error (success=false): %s", error_message)
                 # Convert to the standard format expected by higher layers
                 response = {
                     "status": "error",
                     "error": error_message
                 }
             
-            # Always close the connection after command is complete
-            # since Unreal will close it on its side anyway
-            try:
-                self.socket.close()
-            except:
-                pass
-            self.socket = None
-            self.connected = False
-            
             return response
             
         except Exception as e:
-            logger.error(f"Error sending command: {e}")
+            logger.error("Error sending command: %s", e)
             # Always reset connection state on any error
             self.connected = False
             try:
@@ -202,37 +435,42 @@ class UnrealConnection:
 
 # Global connection state
 _unreal_connection: UnrealConnection = None
+_unreal_connection_lock = threading.Lock()
 
 def get_unreal_connection() -> Optional[UnrealConnection]:
     """Get the connection to Unreal Engine."""
     global _unreal_connection
+    # Fast path without locking; tools call this from worker threads
+    connection = _unreal_connection
+    if connection is not None and connection.connected:
+        return connection
+    
+    # Only one caller (re)connects, the others reuse its result
+    with _unreal_connection_lock:
+        return _get_or_create_connection()
+
+def _get_or_create_connection() -> Optional[UnrealConnection]:
+    """Create or reconnect the shared connection. Caller must hold the lock."""
+    global _unreal_connection
     try:
         if _unreal_connection is None:
             _unreal_connection = UnrealConnection()
             if not _unreal_connection.connect():
                 logger.warning("Could not connect to Unreal Engine")
                 _unreal_connection = None
-        else:
-            # Verify connection is still valid with a ping-like test
-            try:
-                # Simple test by sending an empty buffer to check if socket is still connected
-                _unreal_connection.socket.sendall(b'\x00')
-                logger.debug("Connection verified with ping test")
-            except Exception as e:
-                logger.warning(f"Existing connection failed: {e}")
-                _unreal_connection.disconnect()
+        elif not _unreal_connection.connected:
+            # The socket is kept open between commands and only released when idle
+            # or dropped. Don't probe a live one: stray bytes would corrupt the
+            # command stream, and send_command reconnects if Unreal closed it.
+            if not _unreal_connection.ensure_connected():
+                logger.warning("Could not reconnect to Unreal Engine")
                 _unreal_connection = None
-                # Try to reconnect
-                _unreal_connection = UnrealConnection()
-                if not _unreal_connection.connect():
-                    logger.warning("Could not reconnect to Unreal Engine")
-                    _unreal_connection = None
-                else:
-                    logger.info("Successfully reconnected to Unreal Engine")
+            else:
+                logger.info("Successfully reconnected to Unreal Engine")
         
         return _unreal_connection
     except Exception as e:
-        logger.error(f"Error getting Unreal connection: {e}")
+        logger.error("Error getting Unreal connection: %s", e)
         return None
 
 @asynccontextmanager
@@ -241,13 +479,14 @@ async def server_lifespan(server: FastMCP) -> AsyncIterator[Dict[str, Any]]:
     global _unreal_connection
     logger.info("UnrealMCP server starting up")
     try:
-        _unreal_connection = get_unreal_connection()
+        # Connect off the event loop so a slow or absent editor doesn't stall startup
+        _unreal_connection = await asyncio.to_thread(get_unreal_connection)
         if _unreal_connection:
             logger.info("Connected to Unreal Engine on startup")
         else:
             logger.warning("Could not connect to Unreal Engine on startup")
     except Exception as e:
-        logger.error(f"Error connecting to Unreal Engine on startup: {e}")
+        logger.error("Error connecting to Unreal Engine on startup: %s", e)
         _unreal_connection = None
     
     try:
@@ -265,6 +504,11 @@ mcp = FastMCP(
     lifespan=server_lifespan
 )
 
+# When started as a script this module is __main__. Register it under its import
+# name as well, so the tools' `from unreal_mcp_server import get_unreal_connection`
+# reuses this module and its connection instead of importing a second copy
+sys.modules.setdefault("unreal_mcp_server", sys.modules[__name__])
+
 # Import and register tools
 from tools.editor_tools import register_editor_tools
 from tools.blueprint_tools import register_blueprint_tools
@@ -279,97 +523,64 @@ register_blueprint_node_tools(mcp)
 register_project_tools(mcp)
 register_umg_tools(mcp)  
 
+_tool_reference: Optional[str] = None
+
+async def get_tool_reference() -> str:
+    """Build the tool list for the info prompt from the registered tools (cached)."""
+    global _tool_reference
+    if _tool_reference is None:
+        lines = []
+        for tool in await mcp.list_tools():
+            params = ", ".join(tool.inputSchema.get("properties", {}))
+            summary = (tool.description or "").strip().split("\n", 1)[0]
+            lines.append(f"- `{tool.name}({params})` - {summary}")
+        _tool_reference = "\n".join(lines)
+    return _tool_reference
+
 @mcp.prompt()
-def info():
+async def info():
     """Information about available Unreal MCP tools and best practices."""
-    return """
-    # Unreal MCP Server Tools and Best Practices
-    
-    ## UMG (Widget Blueprint) Tools
-    - `create_umg_widget_blueprint(widget_name, parent_class="UserWidget", path="/Game/UI")` 
-      Create a new UMG Widget Blueprint
-    - `add_text_block_to_widget(widget_name, text_block_name, text="", position=[0,0], size=[200,50], font_size=12, color=[1,1,1,1])`
-      Add a Text Block widget with customizable properties
-    - `add_button_to_widget(widget_name, button_name, text="", position=[0,0], size=[200,50], font_size=12, color=[1,1,1,1], background_color=[0.1,0.1,0.1,1])`
-      Add a Button widget with text and styling
-    - `bind_widget_event(widget_name, widget_component_name, event_name, function_name="")`
-      Bind events like OnClicked to functions
-    - `add_widget_to_viewport(widget_name, z_order=0)`
-      Add widget instance to game viewport
-    - `set_text_block_binding(widget_name, text_block_name, binding_property, binding_type="Text")`
-      Set up dynamic property binding for text blocks
-
-    ## Editor Tools
-    ### Viewport and Screenshots
-    - `focus_viewport(target, location, distance, orientation)` - Focus viewport
-    - `take_screenshot(filename, show_ui, resolution)` - Capture screenshots
-
-    ### Actor Management
-    - `get_actors_in_level()` - List all actors in current level
-    - `find_actors_by_name(pattern)` - Find actors by name pattern
-    - `spawn_actor(name, type, location=[0,0,0], rotation=[0,0,0], scale=[1,1,1])` - Create actors
-    - `delete_actor(name)` - Remove actors
-    - `set_actor_transform(name, location, rotation, scale)` - Modify actor transform
-    - `get_actor_properties(name)` - Get actor properties
-    
-    ## Blueprint Management
-    - `create_blueprint(name, parent_class)` - Create new Blueprint classes
-    - `add_component_to_blueprint(blueprint_name, component_type, component_name)` - Add components
-    - `set_static_mesh_properties(blueprint_name, component_name, static_mesh)` - Configure meshes
-    - `set_physics_properties(blueprint_name, component_name)` - Configure physics
-    - `compile_blueprint(blueprint_name)` - Compile Blueprint changes
-    - `set_blueprint_property(blueprint_name, property_name, property_value)` - Set properties
-    - `set_pawn_properties(blueprint_name)` - Configure Pawn settings
-    - `spawn_blueprint_actor(blueprint_name, actor_name)` - Spawn Blueprint actors
-    
-    ## Blueprint Node Management
-    - `add_blueprint_event_node(blueprint_name, event_type)` - Add event nodes
-    - `add_blueprint_input_action_node(blueprint_name, action_name)` - Add input nodes
-    - `add_blueprint_function_node(blueprint_name, target, function_name)` - Add function nodes
-    - `connect_blueprint_nodes(blueprint_name, source_node_id, source_pin, target_node_id, target_pin)` - Connect nodes
-    - `add_blueprint_variable(blueprint_name, variable_name, variable_type)` - Add variables
-    - `add_blueprint_get_self_component_reference(blueprint_name, component_name)` - Add component refs
-    - `add_blueprint_self_reference(blueprint_name)` - Add self references
-    - `find_blueprint_nodes(blueprint_name, node_type, event_type)` - Find nodes
-    
-    ## Project Tools
-    - `create_input_mapping(action_name, key, input_type)` - Create input mappings
-    
-    ## Best Practices
-    
-    ### UMG Widget Development
-    - Create widgets with descriptive names that reflect their purpose
-    - Use consistent naming conventions for widget components
-    - Organize widget hierarchy logically
-    - Set appropriate anchors and alignment for responsive layouts
-    - Use property bindings for dynamic updates instead of direct setting
-    - Handle widget events appropriately with meaningful function names
-    - Clean up widgets when no longer needed
-    - Test widget layouts at different resolutions
-    
-    ### Editor and Actor Management
-    - Use unique names for actors to avoid conflicts
-    - Clean up temporary actors
-    - Validate transforms before applying
-    - Check actor existence before modifications
-    - Take regular viewport screenshots during development
-    - Keep the viewport focused on relevant actors during operations
-    
-    ### Blueprint Development
-    - Compile Blueprints after changes
-    - Use meaningful names for variables and functions
-    - Organize nodes logically
-    - Test functionality in isolation
-    - Consider performance implications
-    - Document complex setups
-    
-    ### Error Handling
-    - Check command responses for success
-    - Handle errors gracefully
-    - Log important operations
-    - Validate parameters
-    - Clean up resources on errors
-    """
+    return f"""
+# Unreal MCP Server Tools and Best Practices
+
+## Tools
+{await get_tool_reference()}
+
+## Best Practices
+
+### UMG Widget Development
+- Create widgets with descriptive names that reflect their purpose
+- Use consistent naming conventions for widget components
+- Organize widget hierarchy logically
+- Set appropriate anchors and alignment for responsive layouts
+- Use property bindings for dynamic updates instead of direct setting
+- Handle widget events appropriately with meaningful function names
+- Clean up widgets when no longer needed
+- Test widget layouts at different resolutions
+
+### Editor and Actor Management
+- Use unique names for actors to avoid conflicts
+- Clean up temporary actors
+- Validate transforms before applying
+- Check actor existence before modifications
+- Take regular viewport screenshots during development
+- Keep the viewport focused on relevant actors during operations
+
+### Blueprint Development
+- Compile Blueprints after changes
+- Use meaningful names for variables and functions
+- Organize nodes logically
+- Test functionality in isolation
+- Consider performance implications
+- Document complex setups
+
+### Error Handling
+- Check command responses for success
+- Handle errors gracefully
+- Log important operations
+- Validate parameters
+- Clean up resources on errors
+"""
 
 # Run the server
 if __name__ == "__main__":